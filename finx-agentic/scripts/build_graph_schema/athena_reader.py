@@ -1,5 +1,16 @@
 import boto3
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional
+
+
+@lru_cache(maxsize=8)
+def _get_glue_client(profile: Optional[str], region: str) -> Any:
+    # Client construction loads the service model from disk, which costs far
+    # more than a typical Glue call; readers for the same account share one.
+    if profile:
+        return boto3.Session(profile_name=profile, region_name=region).client("glue")
+    return boto3.client("glue", region_name=region)
 
 
 class AthenaSchemaReader:
@@ -12,37 +23,56 @@ class AthenaSchemaReader:
     ):
         self.database = database
         self.region = region
-        
-        if profile:
-            session = boto3.Session(profile_name=profile, region_name=region)
-            self.glue = session.client("glue")
-        else:
-            self.glue = boto3.client("glue", region_name=region)
+        self.glue = _get_glue_client(profile, region)
     
     def get_all_tables(self) -> List[str]:
-        tables = []
-        paginator = self.glue.get_paginator("get_tables")
-        for page in paginator.paginate(DatabaseName=self.database):
-            for table in page.get("TableList", []):
-                tables.append(table["Name"])
-        return tables
+        return [table["Name"] for table in self._iter_tables()]
     
     def get_table_schema(self, table_name: str) -> Dict[str, Any]:
         response = self.glue.get_table(
             DatabaseName=self.database,
             Name=table_name
         )
-        table = response["Table"]
-        
-        columns = []
-        for col in table.get("StorageDescriptor", {}).get("Columns", []):
-            columns.append({
+        return self._to_schema(response["Table"])
+    
+    def get_table_schemas(self, table_names: List[str], max_workers: int = 4) -> List[Dict[str, Any]]:
+        if max_workers <= 1 or len(table_names) <= 1:
+            return [self.get_table_schema(table_name) for table_name in table_names]
+        # Glue latency dominates; boto3 clients are thread-safe, so overlap
+        # the per-table get_table calls. map() keeps the requested order.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_table_schema, table_names))
+    
+    def get_all_schemas(self) -> List[Dict[str, Any]]:
+        # get_tables pages already carry full table metadata, so no
+        # per-table get_table round-trip is needed.
+        return [self._to_schema(table) for table in self._iter_tables()]
+    
+    def _iter_tables(self) -> Iterator[Dict[str, Any]]:
+        paginator = self.glue.get_paginator("get_tables")
+        pages = paginator.paginate(
+            DatabaseName=self.database,
+            PaginationConfig={"PageSize": 100},
+        )
+        for page in pages:
+            yield from page.get("TableList", [])
+    
+    def _to_schema(self, table: Dict[str, Any]) -> Dict[str, Any]:
+        storage = table.get("StorageDescriptor", {})
+        columns = [
+            {
                 "name": col["Name"],
                 "type": col.get("Type", "string"),
                 "description": col.get("Comment", "")
-            })
-        
+            }
+            for col in storage.get("Columns", [])
+        ]
+        seen = {col["name"]: col for col in columns}
         for col in table.get("PartitionKeys", []):
+            existing = seen.get(col["Name"])
+            if existing is not None:
+                existing["is_partition"] = True
+                continue
             columns.append({
                 "name": col["Name"],
                 "type": col.get("Type", "string"),
@@ -51,18 +81,9 @@ class AthenaSchemaReader:
             })
         
         return {
-            "name": table_name,
+            "name": table["Name"],
             "description": table.get("Description", ""),
             "columns": columns,
-            "location": table.get("StorageDescriptor", {}).get("Location", ""),
+            "location": storage.get("Location", ""),
             "database": self.database
         }
-    
-    def get_all_schemas(self) -> List[Dict[str, Any]]:
-        schemas = []
-        tables = self.get_all_tables()
-        for table_name in tables:
-            schema = self.get_table_schema(table_name)
-            schemas.append(schema)
-        return schemas
-
@@ -72,7 +72,7 @@ class SchemaChangeDetector:
         tables: Optional[List[str]] = None,
     ) -> ChangeSet:
         if tables:
-            current_schemas = [self.reader.get_table_schema(t) for t in tables]
+            current_schemas = self.reader.get_table_schemas(tables)
         else:
             current_schemas = self.reader.get_all_schemas()
 
@@ -12,9 +12,10 @@ def create_chart_builder_agent(
     session_id: Optional[str] = None,
     session_state: Optional[Dict[str, Any]] = None,
     db: Optional[BaseDb] = None,
+    instructions: Optional[str] = None,
 ) -> Agent:
-    pm = get_prompt_manager()
-    instructions = pm.render("chart_builder/instructions.jinja2")
+    if instructions is None:
+        instructions = get_prompt_manager().render("chart_builder/instructions.jinja2")
 
     chart_tools = ChartBuilderTools()
 
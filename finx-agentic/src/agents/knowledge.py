@@ -15,9 +15,10 @@ def create_knowledge_agent(
     session_id: Optional[str] = None,
     session_state: Optional[Dict[str, Any]] = None,
     db: Optional[BaseDb] = None,
+    instructions: Optional[str] = None,
 ) -> Agent:
-    pm = get_prompt_manager()
-    instructions = pm.render("knowledge/instructions.jinja2")
+    if instructions is None:
+        instructions = get_prompt_manager().render("knowledge/instructions.jinja2")
 
     knowledge = GraphKnowledge(
         client=graphiti_client,
@@ -18,9 +18,10 @@ def create_sql_generator_agent(
     session_id: Optional[str] = None,
     session_state: Optional[Dict[str, Any]] = None,
     db: Optional[BaseDb] = None,
+    instructions: Optional[str] = None,
 ) -> Agent:
-    pm = get_prompt_manager()
-    instructions = pm.render("sql_generator/instructions.jinja2")
+    if instructions is None:
+        instructions = get_prompt_manager().render("sql_generator/instructions.jinja2")
 
     executor = AthenaDirectExecutor(
         database=database,
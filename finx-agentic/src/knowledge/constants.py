@@ -3,6 +3,25 @@
 # Graph group
 DEFAULT_GROUP_ID = "finx_schema"
 
+# Graph writes: max texts per embedder.create_batch call
+EMBEDDING_BATCH_SIZE = 256
+
 # Search defaults
 DEFAULT_TOP_K = 3
 DEFAULT_SIMILARITY_THRESHOLD = 0.7
+
+# Semantic cache over schema_retrieval results
+SEMANTIC_CACHE_SIZE = 256
+SEMANTIC_CACHE_THRESHOLD = 0.95
+SEMANTIC_CACHE_TTL_S = 300.0
+
+# Per-table context cache in SchemaRetrievalService (schema changes only on DDL)
+TABLE_CONTEXT_CACHE_SIZE = 512
+TABLE_CONTEXT_TTL_S = 300.0
+
+# Join-path cache in EntityQueries.find_join_path
+JOIN_PATH_CACHE_SIZE = 1024
+JOIN_PATH_TTL_S = 300.0
+
+# In-memory term → entity index behind EntityQueries.resolve_term
+TERM_INDEX_TTL_S = 300.0
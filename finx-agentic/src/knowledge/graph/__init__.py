@@ -1,5 +1,8 @@
-from src.knowledge.graph.client import GraphitiClient, get_graphiti_client
+from src.knowledge.graph.client import (
+    GraphitiClient, bump_schema_generation, close_all, get_graphiti_client, schema_generation,
+)
 from src.knowledge.graph.cost_tracker import GraphCostTracker, EmbeddingCall
+from src.knowledge.graph.falkor_driver import CachedFalkorDriver
 
 # Schemas re-exports (canonical location: graph.schemas)
 from src.knowledge.graph.schemas import BaseNode, BaseEdge
@@ -25,6 +28,10 @@ GraphLoader = SchemaIndexer  # deprecated alias
 __all__ = [
     "GraphitiClient",
     "get_graphiti_client",
+    "close_all",
+    "schema_generation",
+    "bump_schema_generation",
+    "CachedFalkorDriver",
     "GraphLoader",
     "GraphCostTracker",
     "EmbeddingCall",
@@ -1,21 +1,93 @@
+import asyncio
 import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from graphiti_core import Graphiti
-from graphiti_core.driver.falkordb_driver import FalkorDriver
+from graphiti_core.driver.falkordb import STOPWORDS as FALKOR_STOPWORDS
 from graphiti_core.embedder import OpenAIEmbedder, OpenAIEmbedderConfig
 from graphiti_core.nodes import EntityNode
 from graphiti_core.edges import EntityEdge
 
-from src.knowledge.constants import DEFAULT_GROUP_ID
+from src.knowledge.constants import DEFAULT_GROUP_ID, EMBEDDING_BATCH_SIZE
 from src.knowledge.graph.cost_tracker import GraphCostTracker, EmbeddingCall
+from src.knowledge.graph.falkor_driver import CachedFalkorDriver
 from src.core.cost_tracker import estimate_cost
 
+try:
+    import orjson
+except ImportError:  # optional: C JSON encoder for the attributes property
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_EMPTY_ATTRIBUTES = "{}"
+
+_NODE_UPSERT_Q = """
+UNWIND $rows AS r
+MERGE (n:{label} {{name: r.name, group_id: r.group_id}})
+SET n.uuid       = r.uuid,
+    n.created_at = r.created_at,
+    n.summary    = r.summary,
+    n.attributes = r.attributes,
+    n.embedding  = vecf32(r.embedding)
+"""
+
+_EDGE_UPSERT_Q = """
+UNWIND $rows AS r
+MATCH (source {{uuid: r.source_uuid}})
+MATCH (target {{uuid: r.target_uuid}})
+MERGE (source)-[e:{rel_type} {{
+    source_node_uuid: r.source_uuid,
+    target_node_uuid: r.target_uuid
+}}]->(target)
+SET e.uuid       = r.uuid,
+    e.group_id   = r.group_id,
+    e.created_at = r.created_at,
+    e.fact       = r.fact,
+    e.attributes = r.attributes
+"""
+
+
+@lru_cache(maxsize=None)
+def _node_upsert_query(label: str) -> str:
+    # One interned string per label: identical text on every batch keeps the
+    # driver's header/read-only caches and FalkorDB's plan cache warm.
+    return _NODE_UPSERT_Q.format(label=label)
+
+
+@lru_cache(maxsize=None)
+def _edge_upsert_query(rel_type: str) -> str:
+    return _EDGE_UPSERT_Q.format(rel_type=rel_type)
+
+
+# Process-wide count of schema writes. Read-side caches remember the value
+# they were filled under and drop their entries when it moves, so a reindex
+# through any client (the API's or an agent's) reaches every reader.
+_schema_generation = 0
+
+
+def schema_generation() -> int:
+    return _schema_generation
+
+
+def bump_schema_generation() -> None:
+    global _schema_generation
+    _schema_generation += 1
+
+
+def dump_attributes(attributes: Optional[Dict[str, Any]]) -> str:
+    """Canonical JSON for the ``attributes`` property (stable across writes)."""
+    if not attributes:
+        return _EMPTY_ATTRIBUTES
+    if orjson is not None:
+        return orjson.dumps(attributes, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(attributes, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+
 
 class GraphitiClient:
 
@@ -31,110 +103,222 @@ class GraphitiClient:
         self.group_id = group_id
         self._embedder = embedder
         self._graphiti: Optional[Graphiti] = None
+        self._graphiti_lock = threading.Lock()
         self.cost_tracker = GraphCostTracker()
 
     @property
     def graphiti(self) -> Graphiti:
         if self._graphiti is None:
-            driver = FalkorDriver(host=self.host, port=self.port)
-            if self._embedder is None:
-                self._embedder = OpenAIEmbedder(
-                    config=OpenAIEmbedderConfig(
-                        embedding_model="text-embedding-3-large",
-                        embedding_dim=3072,
-                    )
-                )
-            self._graphiti = Graphiti(graph_driver=driver, embedder=self._embedder)
+            with self._graphiti_lock:
+                if self._graphiti is None:
+                    driver = CachedFalkorDriver(host=self.host, port=self.port)
+                    if self._embedder is None:
+                        self._embedder = OpenAIEmbedder(
+                            config=OpenAIEmbedderConfig(
+                                embedding_model="text-embedding-3-large",
+                                embedding_dim=3072,
+                            )
+                        )
+                    self._graphiti = Graphiti(graph_driver=driver, embedder=self._embedder)
         return self._graphiti
 
-    async def initialize(self) -> None:
+    async def initialize(self, force: bool = False) -> None:
+        """Create graphiti and vector indexes once per index layout.
+
+        The layout version is stored on a ``_SchemaMeta`` node; when it
+        matches, the DROP/CREATE round-trips (and the vector re-index they
+        trigger) are skipped. ``force=True`` rebuilds unconditionally.
+        """
+        driver = self.graphiti.driver
+        if not force:
+            result = await driver.execute_query(
+                "MATCH (m:_SchemaMeta {key: 'indexes'}) RETURN m.version AS version"
+            )
+            records = result[0] if result else []
+            if records and records[0].get("version") == self._INDEX_VERSION:
+                logger.debug("Graph indexes already at %s", self._INDEX_VERSION)
+                return
+
         await self.graphiti.build_indices_and_constraints()
-        await self._create_vector_indexes()
+        await asyncio.gather(
+            self._create_vector_indexes(),
+            self._create_range_indexes(),
+            self._create_fulltext_indexes(),
+        )
+        await driver.execute_query(
+            "MERGE (m:_SchemaMeta {key: 'indexes'}) SET m.version = $version",
+            version=self._INDEX_VERSION,
+        )
 
     _VECTOR_LABELS = [
         "Table", "Column", "BusinessEntity", "Domain", "BusinessRule", "CodeSet",
     ]
+    _FULLTEXT_LABELS = ["QueryPattern"]
     _EMBEDDING_DIM = 3072
+    # Derived from the index layout so any change to it forces a rebuild.
+    _INDEX_VERSION = (
+        f"v3:{_EMBEDDING_DIM}:{','.join(_VECTOR_LABELS)}:{','.join(_FULLTEXT_LABELS)}"
+    )
 
     async def _create_vector_indexes(self) -> None:
+        await asyncio.gather(*(self._create_vector_index(label) for label in self._VECTOR_LABELS))
+
+    async def _create_range_indexes(self) -> None:
+        await asyncio.gather(*(self._create_range_index(label) for label in self._VECTOR_LABELS))
+
+    async def _create_range_index(self, label: str) -> None:
+        # add_nodes MERGEs on (name, group_id): a composite index lets that
+        # be a single index seek. Older FalkorDB builds reject composite
+        # range indexes, so fall back to one index per property.
         driver = self.graphiti.driver
-        for label in self._VECTOR_LABELS:
-            try:
-                await driver.execute_query(f"DROP INDEX ON :{label}(embedding)")
-            except Exception:
-                pass
-            try:
-                await driver.execute_query(
-                    f"CREATE VECTOR INDEX FOR (n:{label}) ON (n.embedding) "
-                    f"OPTIONS {{dimension: {self._EMBEDDING_DIM}, similarityFunction: 'cosine'}}"
-                )
-            except Exception:
-                pass
+        try:
+            await driver.execute_query(f"CREATE INDEX FOR (n:{label}) ON (n.name, n.group_id)")
+        except Exception:
+            for prop in ("name", "group_id"):
+                try:
+                    await driver.execute_query(f"CREATE INDEX FOR (n:{label}) ON (n.{prop})")
+                except Exception:
+                    pass
+        try:
+            await driver.execute_query(f"CREATE INDEX FOR (n:{label}) ON (n.uuid)")
+        except Exception:
+            pass
+
+    async def _create_fulltext_indexes(self) -> None:
+        await asyncio.gather(*(self._create_fulltext_index(label) for label in self._FULLTEXT_LABELS))
+
+    async def _create_fulltext_index(self, label: str) -> None:
+        # Same shape as graphiti's own Entity index, so the driver's
+        # build_fulltext_query() (stopwords, @group_id filter) applies as-is.
+        try:
+            await self.graphiti.driver.execute_query(
+                f"CALL db.idx.fulltext.createNodeIndex("
+                f"{{label: '{label}', stopwords: {list(FALKOR_STOPWORDS)}}}, "
+                f"'name', 'summary', 'group_id')"
+            )
+        except Exception:
+            pass
+
+    async def _create_vector_index(self, label: str) -> None:
+        driver = self.graphiti.driver
+        try:
+            await driver.execute_query(f"DROP INDEX ON :{label}(embedding)")
+        except Exception:
+            pass
+        try:
+            await driver.execute_query(
+                f"CREATE VECTOR INDEX FOR (n:{label}) ON (n.embedding) "
+                f"OPTIONS {{dimension: {self._EMBEDDING_DIM}, similarityFunction: 'cosine'}}"
+            )
+        except Exception:
+            pass
 
     async def add_node(self, node: EntityNode) -> EntityNode:
-        description = (node.summary or "").replace("\n", " ").strip()
-        embedding: List[float] = []
-        if description:
-            start = time.monotonic()
-            embedding = await self._embedder.create(input_data=[description])
-            embed_duration = time.monotonic() - start
-            estimated_tokens = max(1, len(description) // 4)
-            cost = estimate_cost(
-                self.cost_tracker.embedding_model, estimated_tokens, 0,
-            ) or 0.0
-            self.cost_tracker.add(EmbeddingCall(
-                node_label=node.labels[0] if node.labels else "Unknown",
-                node_name=node.name,
-                text_length=len(description),
-                estimated_tokens=estimated_tokens,
-                cost_usd=cost,
-                duration_s=embed_duration,
-            ))
-
-        await self.graphiti.driver.execute_query(
-            f"""
-            MERGE (n:{node.labels[0]} {{name: $name, group_id: $group_id}})
-            SET n.uuid       = $uuid,
-                n.created_at = $created_at,
-                n.summary    = $summary,
-                n.attributes = $attributes,
-                n.embedding  = vecf32($embedding)
-            """,
-            uuid=node.uuid,
-            name=node.name,
-            group_id=node.group_id,
-            created_at=node.created_at.isoformat(),
-            summary=node.summary or "",
-            attributes=json.dumps(node.attributes or {}),
-            embedding=embedding,
-        )
+        await self.add_nodes([node])
         return node
 
     async def add_edge(self, edge: EntityEdge) -> EntityEdge:
-        await self.graphiti.driver.execute_query(
-            f"""
-            MATCH (source {{uuid: $source_uuid}})
-            MATCH (target {{uuid: $target_uuid}})
-            MERGE (source)-[r:{edge.name} {{
-                source_node_uuid: $source_uuid,
-                target_node_uuid: $target_uuid
-            }}]->(target)
-            SET r.uuid       = $uuid,
-                r.group_id   = $group_id,
-                r.created_at = $created_at,
-                r.fact       = $fact,
-                r.attributes = $attributes
-            """,
-            source_uuid=edge.source_node_uuid,
-            target_uuid=edge.target_node_uuid,
-            uuid=edge.uuid,
-            group_id=edge.group_id,
-            created_at=edge.created_at.isoformat(),
-            fact=edge.fact or "",
-            attributes=json.dumps(edge.attributes or {}),
-        )
+        await self.add_edges([edge])
         return edge
 
+    async def add_nodes(
+        self, nodes: List[EntityNode], created_at: Optional[str] = None,
+    ) -> List[EntityNode]:
+        """Upsert *nodes* with one embedding batch and one ``UNWIND`` MERGE per label.
+
+        Nodes that share ``(label, name, group_id)`` collapse onto the first
+        node's uuid (last properties win), so edges built from any of them
+        still resolve after the batch is written. *created_at* (ISO string)
+        stamps every row instead of each node's own timestamp.
+        """
+        rows_by_label: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        for node in nodes:
+            label = node.labels[0]
+            rows = rows_by_label.setdefault(label, {})
+            key = (node.name, node.group_id)
+            existing = rows.get(key)
+            if existing is not None:
+                node.uuid = existing["uuid"]
+            rows[key] = {
+                "uuid": node.uuid,
+                "name": node.name,
+                "group_id": node.group_id,
+                "created_at": created_at or node.created_at.isoformat(),
+                "summary": node.summary or "",
+                "attributes": dump_attributes(node.attributes),
+                "embedding": [],
+            }
+
+        # Labels are independent: embed and write them concurrently so
+        # embedder and FalkorDB round-trips overlap.
+        await asyncio.gather(*(
+            self._write_label(label, list(rows.values()))
+            for label, rows in rows_by_label.items()
+        ))
+        return nodes
+
+    async def _write_label(self, label: str, rows: List[Dict[str, Any]]) -> None:
+        await self._embed_rows(label, rows)
+        await self.graphiti.driver.execute_query(_node_upsert_query(label), rows=rows)
+
+    async def add_edges(
+        self, edges: List[EntityEdge], created_at: Optional[str] = None,
+    ) -> List[EntityEdge]:
+        """Upsert *edges* with one ``UNWIND`` MERGE per relationship type."""
+        rows_by_type: Dict[str, List[Dict[str, Any]]] = {}
+        for edge in edges:
+            rows_by_type.setdefault(edge.name, []).append({
+                "source_uuid": edge.source_node_uuid,
+                "target_uuid": edge.target_node_uuid,
+                "uuid": edge.uuid,
+                "group_id": edge.group_id,
+                "created_at": created_at or edge.created_at.isoformat(),
+                "fact": edge.fact or "",
+                "attributes": dump_attributes(edge.attributes),
+            })
+
+        driver = self.graphiti.driver
+        await asyncio.gather(*(
+            driver.execute_query(_edge_upsert_query(rel_type), rows=rows)
+            for rel_type, rows in rows_by_type.items()
+        ))
+        return edges
+
+    async def _embed_rows(self, label: str, rows: List[Dict[str, Any]]) -> None:
+        """Fill ``row["embedding"]`` for rows with a summary, batching embedder calls."""
+        todo = [
+            (row, text) for row in rows
+            if (text := row["summary"].replace("\n", " ").strip())
+        ]
+        if not todo:
+            return
+        _ = self.graphiti  # builds the default embedder on first use
+        embedder = self._embedder
+        for i in range(0, len(todo), EMBEDDING_BATCH_SIZE):
+            chunk = todo[i:i + EMBEDDING_BATCH_SIZE]
+            texts = [text for _, text in chunk]
+            start = time.monotonic()
+            try:
+                vectors = await embedder.create_batch(texts)
+            except NotImplementedError:
+                vectors = [await embedder.create(input_data=[t]) for t in texts]
+            per_item_s = (time.monotonic() - start) / len(chunk)
+
+            for (row, text), vector in zip(chunk, vectors):
+                row["embedding"] = vector
+                estimated_tokens = max(1, len(text) // 4)
+                cost = estimate_cost(
+                    self.cost_tracker.embedding_model, estimated_tokens, 0,
+                ) or 0.0
+                self.cost_tracker.add(EmbeddingCall(
+                    node_label=label,
+                    node_name=row["name"],
+                    text_length=len(text),
+                    estimated_tokens=estimated_tokens,
+                    cost_usd=cost,
+                    duration_s=per_item_s,
+                ))
+
     async def close(self) -> None:
         if self._graphiti is not None:
             await self._graphiti.close()
@@ -148,7 +332,10 @@ class GraphitiClient:
             return False
 
 
-_client_instance: Optional[GraphitiClient] = None
+_ClientKey = Tuple[str, int, str]
+
+_clients: Dict[_ClientKey, GraphitiClient] = {}
+_clients_lock = threading.Lock()
 
 
 def get_graphiti_client(
@@ -156,13 +343,33 @@ def get_graphiti_client(
     port: Optional[int] = None,
     group_id: str = DEFAULT_GROUP_ID,
 ) -> GraphitiClient:
-    global _client_instance
-    if _client_instance is None:
-        resolved_host = host or os.getenv("FALKORDB_HOST", "localhost")
-        resolved_port = port or int(os.getenv("FALKORDB_PORT", "6379"))
-        _client_instance = GraphitiClient(
-            host=resolved_host,
-            port=resolved_port,
-            group_id=group_id,
-        )
-    return _client_instance
+    """Return the shared client for ``(host, port, group_id)``, creating it once.
+
+    Arguments are resolved against ``FALKORDB_HOST`` / ``FALKORDB_PORT``
+    before lookup so implicit and explicit defaults share one connection.
+    """
+    key = (
+        host or os.getenv("FALKORDB_HOST", "localhost"),
+        port or int(os.getenv("FALKORDB_PORT", "6379")),
+        group_id,
+    )
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = GraphitiClient(host=key[0], port=key[1], group_id=key[2])
+                _clients[key] = client
+    return client
+
+
+async def close_all() -> None:
+    """Close every client handed out by :func:`get_graphiti_client`."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning("Failed to close graph client %s:%s: %s", client.host, client.port, e)
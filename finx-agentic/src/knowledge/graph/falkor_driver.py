@@ -0,0 +1,88 @@
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from graphiti_core.driver.falkordb_driver import FalkorDriver
+
+try:
+    from graphiti_core.driver.falkordb_driver import _strip_nul_bytes
+except ImportError:  # older graphiti-core releases do not sanitise NUL bytes
+    def _strip_nul_bytes(value: Any) -> Any:
+        return value
+
+logger = logging.getLogger(__name__)
+
+_HEADER_CACHE_SIZE = 512
+
+_RO_PREFIXES = ("MATCH", "OPTIONAL", "CALL", "RETURN", "WITH", "UNWIND")
+# Deliberately loose (prefix match, no trailing boundary): a false positive
+# such as ``n.created_at`` only sends a read through GRAPH.QUERY, while
+# ``CALL db.idx.fulltext.createNodeIndex`` must never reach GRAPH.RO_QUERY.
+_WRITE_TOKENS = re.compile(r"\b(?:CREATE|MERGE|SET|DELETE|DETACH|REMOVE|DROP)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
+def _is_read_only(query: str) -> bool:
+    return query.lstrip().upper().startswith(_RO_PREFIXES) and not _WRITE_TOKENS.search(query)
+
+
+class CachedFalkorDriver(FalkorDriver):
+    """FalkorDriver that memoises result-header parsing per Cypher string.
+
+    The same query text always yields the same column layout, so the
+    ``[h[1] for h in result.header]`` pass is done once per distinct query and
+    rows are turned into records with a single ``dict(zip(...))``. Graph
+    handles are kept per graph name instead of calling ``select_graph`` on
+    every query, and statements without write clauses are sent through
+    ``GRAPH.RO_QUERY`` so replicas and the read-only plan path can serve them.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._header_cache: Dict[str, Tuple[str, ...]] = {}
+        self._graphs: Dict[str, Any] = {}
+
+    def _get_graph(self, graph_name: Optional[str]) -> Any:
+        name = graph_name or self._database
+        graph = self._graphs.get(name)
+        if graph is None:
+            graph = self._graphs.setdefault(name, self.client.select_graph(name))
+        return graph
+
+    def _headers_for(self, query: str, raw_header: Any) -> Tuple[str, ...]:
+        headers = self._header_cache.get(query)
+        if headers is None:
+            headers = tuple(h[1] for h in raw_header)
+            if len(self._header_cache) >= _HEADER_CACHE_SIZE:
+                self._header_cache.clear()
+            self._header_cache[query] = headers
+        return headers
+
+    async def execute_query(self, cypher_query_, **kwargs: Any):
+        graph = self._get_graph(self._database)
+
+        params = _strip_nul_bytes(self.convert_datetimes_to_strings(dict(kwargs)))
+
+        try:
+            if _is_read_only(cypher_query_):
+                result = await graph.ro_query(cypher_query_, params)
+            else:
+                result = await graph.query(cypher_query_, params)
+        except Exception as e:
+            if "already indexed" in str(e):
+                logger.info(f"Index already exists: {e}")
+                return None
+            logger.error(f"Error executing FalkorDB query: {e}\n{cypher_query_}\n{params}")
+            raise
+
+        headers = self._headers_for(cypher_query_, result.header)
+        records = [dict(zip(headers, row)) for row in result.result_set]
+        return records, list(headers), None
+
+    def clone(self, database: str) -> "CachedFalkorDriver":
+        if database == self._database:
+            return self
+        if database == self.default_group_id:
+            return CachedFalkorDriver(falkor_db=self.client)
+        return CachedFalkorDriver(falkor_db=self.client, database=database)
@@ -52,16 +52,20 @@ class GraphKnowledge:
         max_results = kwargs.get("max_results", self._max_results)
         database = kwargs.get("database", self._default_database)
 
-        try:
-            schema_result = await self._search.schema_retrieval(
+        # Schema retrieval and the past-query lookup are independent round-trips.
+        schema_result, similar_queries = await asyncio.gather(
+            self._search.schema_retrieval(
                 query=query,
                 database=database,
                 top_k=max_results,
                 include_patterns=True,
                 include_context=True,
-            )
-        except Exception as e:
-            logger.warning("schema_retrieval failed: %s", e)
+            ),
+            self._episodes.search_similar_queries(query, top_k=3),
+            return_exceptions=True,
+        )
+        if isinstance(schema_result, BaseException):
+            logger.warning("schema_retrieval failed: %s", schema_result)
             return []
 
         result_dict = schema_result.to_dict()
@@ -137,10 +141,9 @@ class GraphKnowledge:
                     meta_data={"type": "query_pattern"},
                 ))
 
-        try:
-            similar_queries = await self._episodes.search_similar_queries(
-                query, top_k=3,
-            )
+        if isinstance(similar_queries, BaseException):
+            logger.debug("similar_queries lookup failed: %s", similar_queries)
+        else:
             for sq in similar_queries:
                 if isinstance(sq, dict):
                     documents.append(Document(
@@ -148,8 +151,6 @@ class GraphKnowledge:
                         content=json.dumps(sq, default=str, ensure_ascii=False),
                         meta_data={"type": "similar_query"},
                     ))
-        except Exception as e:
-            logger.debug("similar_queries lookup failed: %s", e)
 
         if result_dict.get("query_analysis"):
             documents.append(Document(
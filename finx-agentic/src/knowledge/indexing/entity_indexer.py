@@ -1,13 +1,13 @@
 """EntityIndexer — register (upsert) entity nodes and edges into the graph."""
 
-import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from graphiti_core.nodes import EntityNode
 from graphiti_core.edges import EntityEdge
 
-from src.knowledge.graph.client import GraphitiClient
+from src.knowledge.graph.client import GraphitiClient, bump_schema_generation, dump_attributes
+from src.knowledge.graph.schemas import BaseEdge, BaseNode
 from src.knowledge.graph.schemas.enums import NodeLabel
 from src.knowledge.graph.schemas.nodes import (
     BusinessEntityNode,
@@ -92,6 +92,14 @@ class EntityIndexer:
     async def register_codeset(self, codeset: CodeSetNode) -> EntityNode:
         return await self._upsert_entity(codeset.to_entity_node(self._group_id), NodeLabel.CODE_SET)
 
+    async def register_nodes(self, models: List[BaseNode]) -> List[EntityNode]:
+        """Upsert several node models with one ``UNWIND`` per label."""
+        nodes = await self._client.add_nodes(
+            [model.to_entity_node(self._group_id) for model in models]
+        )
+        bump_schema_generation()
+        return nodes
+
     async def _upsert_entity(self, node: EntityNode, label: NodeLabel) -> EntityNode:
         description = (node.summary or "").replace("\n", " ").strip()
         embedding = await self._embed(description) if description else []
@@ -110,9 +118,10 @@ class EntityIndexer:
             group_id=node.group_id,
             created_at=node.created_at.isoformat(),
             summary=node.summary or "",
-            attributes=json.dumps(node.attributes or {}),
+            attributes=dump_attributes(node.attributes),
             embedding=embedding,
         )
+        bump_schema_generation()
         return node
 
     # ── register edges ───────────────────────────────────────────────
@@ -132,6 +141,16 @@ class EntityIndexer:
     async def register_synonym(self, edge: SynonymEdge, source_uuid: str, target_uuid: str) -> None:
         await self._upsert_edge(edge.to_entity_edge(source_uuid, target_uuid, self._group_id))
 
+    async def register_synonyms(
+        self, edges: List[SynonymEdge], source_uuid: str, target_uuids: List[str],
+    ) -> None:
+        """Register all synonyms of one term in a single round-trip."""
+        await self._client.add_edges([
+            edge.to_entity_edge(source_uuid, target_uuid, self._group_id)
+            for edge, target_uuid in zip(edges, target_uuids)
+        ])
+        bump_schema_generation()
+
     async def register_query_pattern_edge(self, edge: QueryPatternEdge, pattern_uuid: str, table_uuid: str) -> None:
         await self._upsert_edge(edge.to_entity_edge(pattern_uuid, table_uuid, self._group_id))
 
@@ -156,32 +175,21 @@ class EntityIndexer:
     async def register_derived_from(self, edge: DerivedFromEdge, source_uuid: str, target_uuid: str) -> None:
         await self._upsert_edge(edge.to_entity_edge(source_uuid, target_uuid, self._group_id))
 
+    async def register_edges(self, edges: List[Tuple[BaseEdge, str, str]]) -> None:
+        """Upsert ``(edge, source_uuid, target_uuid)`` triples with one ``UNWIND`` per type."""
+        await self._client.add_edges([
+            edge.to_entity_edge(source_uuid, target_uuid, self._group_id)
+            for edge, source_uuid, target_uuid in edges
+        ])
+        bump_schema_generation()
+
     async def _upsert_edge(self, edge: EntityEdge) -> None:
-        await self._execute(
-            f"""
-            MATCH (source {{uuid: $source_uuid}})
-            MATCH (target {{uuid: $target_uuid}})
-            MERGE (source)-[r:{edge.name} {{
-                source_node_uuid: $source_uuid,
-                target_node_uuid: $target_uuid
-            }}]->(target)
-            SET r.uuid       = $uuid,
-                r.group_id   = $group_id,
-                r.created_at = $created_at,
-                r.fact       = $fact,
-                r.attributes = $attributes
-            """,
-            source_uuid=edge.source_node_uuid,
-            target_uuid=edge.target_node_uuid,
-            uuid=edge.uuid,
-            group_id=edge.group_id,
-            created_at=edge.created_at.isoformat(),
-            fact=edge.fact or "",
-            attributes=json.dumps(edge.attributes or {}),
-        )
+        await self._client.add_edges([edge])
+        bump_schema_generation()
 
     # ── deletion ─────────────────────────────────────────────────────
 
     async def delete_entity(self, uuid: str) -> bool:
         await self._execute("MATCH (n {uuid: $uuid}) DETACH DELETE n", uuid=uuid)
+        bump_schema_generation()
         return True
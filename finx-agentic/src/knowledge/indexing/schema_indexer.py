@@ -1,11 +1,24 @@
 """SchemaIndexer — reads JSON schema files and loads them into the graph."""
 
+import gzip
+import hashlib
 import json
 import logging
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.knowledge.graph.client import GraphitiClient
+from graphiti_core.edges import EntityEdge
+from graphiti_core.nodes import EntityNode
+
+try:
+    import orjson
+except ImportError:  # optional: C JSON parser for schema files and hashing
+    orjson = None
+
+from src.knowledge.graph.client import GraphitiClient, bump_schema_generation
 from src.knowledge.graph.schemas.nodes import (
     BusinessEntityNode,
     BusinessRuleNode,
@@ -27,6 +40,45 @@ from src.knowledge.graph.schemas.edges import (
 
 logger = logging.getLogger(__name__)
 
+_CACHE_DIR = Path(os.getenv("FINX_CACHE_DIR", Path.home() / ".cache" / "finx")) / "schema_indexer"
+
+
+_SCHEMA_SUFFIXES = (".json", ".json.gz")
+# Files whose nodes/edges are written together: one UNWIND per label and
+# relationship type covers the whole batch instead of each table.
+_LOAD_BATCH_FILES = 32
+
+
+@lru_cache(maxsize=1)
+def _s3_client() -> Any:
+    import boto3  # imported on first S3 load only; local loads never pay for it
+
+    return boto3.client("s3")
+
+
+def _split_s3_uri(uri: str) -> Tuple[str, str]:
+    bucket, _, key = uri[len("s3://"):].partition("/")
+    return bucket, key
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _canonical_json(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    _loads = json.loads
+
+    def _canonical_json(obj: Any) -> bytes:
+        # Byte-identical to orjson's output so schema hashes agree across hosts.
+        return json.dumps(
+            obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+        ).encode("utf-8")
+
+
+def _schema_hash(schema_data: Dict[str, Any]) -> str:
+    return hashlib.blake2b(_canonical_json(schema_data), digest_size=16).hexdigest()
+
 
 class SchemaIndexer:
     """Load JSON schema files into the knowledge graph."""
@@ -39,48 +91,219 @@ class SchemaIndexer:
         schema_path: str,
         database: Optional[str] = None,
         skip_existing: bool = False,
+        force: bool = False,
     ) -> Dict[str, Any]:
-        """Load all ``*.json`` files in *schema_path*."""
-        schema_dir = Path(schema_path)
-        if not schema_dir.exists():
-            raise FileNotFoundError(f"Schema directory not found: {schema_path}")
+        """Load all ``*.json`` / ``*.json.gz`` files in *schema_path*.
+
+        *schema_path* is a local directory or an ``s3://bucket/prefix`` URI;
+        S3 objects are read straight from ``get_object`` with no local copy.
 
-        json_files = [f for f in schema_dir.glob("*.json") if not f.name.startswith("_")]
+        Tables whose schema hash matches the ``_SchemaVersion`` node written
+        by a previous load from any host are skipped and counted as
+        ``unchanged``. The local manifest only saves re-reading a file whose
+        ``(mtime, size)`` or content hash is unchanged, and is trusted only
+        while the graph still holds the hash it recorded. Pass ``force=True``
+        to re-ingest everything (e.g. after wiping the graph).
+        """
+        sources = self._list_sources(schema_path)
 
         stats: Dict[str, int] = {
             "tables": 0, "columns": 0, "entities": 0,
-            "edges": 0, "domains": 0, "codesets": 0, "skipped": 0,
+            "edges": 0, "domains": 0, "codesets": 0, "skipped": 0, "unchanged": 0,
         }
 
         self._client.cost_tracker.calls.clear()
+        manifest = {} if force else self._read_manifest()
+        versions = {} if force else await self._read_versions()
+        loaded_versions: Dict[str, str] = {}
+        # One timestamp for the whole run rather than one per node/edge.
+        loaded_at = datetime.now(timezone.utc).isoformat()
+
+        batch: List[Tuple[str, Dict[str, Any], str, str, Dict[str, int]]] = []
+        batch_nodes: List[EntityNode] = []
+        batch_edges: List[EntityEdge] = []
 
-        for json_file in json_files:
+        async def flush() -> None:
             try:
-                with open(json_file, "r") as f:
-                    schema_data = json.load(f)
+                await self._write_schema(batch_nodes, batch_edges, created_at=loaded_at)
+            except Exception as e:
+                for file_key, *_ in batch:
+                    logger.error("Error loading %s: %s", file_key.rsplit("/", 1)[-1], e)
+            else:
+                for file_key, entry, table_key, schema_hash, file_stats in batch:
+                    for key in stats:
+                        stats[key] += file_stats.get(key, 0)
+                    manifest[file_key] = entry
+                    loaded_versions[table_key] = schema_hash
+            batch.clear()
+            batch_nodes.clear()
+            batch_edges.clear()
+
+        for file_key, mtime_ns, size in sources:
+            try:
+                entry = manifest.get(file_key)
+                if entry and versions.get(entry.get("table")) != entry.get("hash"):
+                    # Graph was wiped or reloaded elsewhere: the graph wins.
+                    del manifest[file_key]
+                    entry = None
+                if entry and entry["mtime_ns"] == mtime_ns and entry["size"] == size:
+                    stats["unchanged"] += 1
+                    continue
+
+                raw = self._read_source(file_key)
+                digest = hashlib.sha256(raw).hexdigest()
+                if entry and entry["sha256"] == digest:
+                    entry.update(mtime_ns=mtime_ns, size=size)
+                    stats["unchanged"] += 1
+                    continue
+
+                schema_data = self._parse_source(file_key, raw)
+
+                table_key = f"{schema_data.get('database', database or 'default')}.{schema_data['name']}"
+                schema_hash = _schema_hash(schema_data)
+                new_entry = {
+                    "mtime_ns": mtime_ns, "size": size, "sha256": digest,
+                    "table": table_key, "hash": schema_hash,
+                }
+                if versions.get(table_key) == schema_hash:
+                    manifest[file_key] = new_entry
+                    stats["unchanged"] += 1
+                    continue
 
                 if skip_existing:
-                    table_name = schema_data["name"]
-                    db = schema_data.get("database", database or "default")
-                    node_name = f"{db}.{table_name}"
-                    if await self._client._node_exists("Table", node_name):
+                    if await self._client._node_exists("Table", table_key):
                         stats["skipped"] += 1
                         continue
 
-                file_stats = await self._load_schema(schema_data, database)
-                for key in stats:
-                    stats[key] += file_stats.get(key, 0)
+                nodes, edges, file_stats = self._collect_schema(schema_data, database)
+                batch.append((file_key, new_entry, table_key, schema_hash, file_stats))
+                batch_nodes.extend(nodes)
+                batch_edges.extend(edges)
             except Exception as e:
-                logger.error("Error loading %s: %s", json_file.name, e)
+                logger.error("Error loading %s: %s", file_key.rsplit("/", 1)[-1], e)
+                continue
 
+            if len(batch) >= _LOAD_BATCH_FILES:
+                await flush()
+
+        if batch:
+            await flush()
+        await self._write_versions(loaded_versions)
+        self._write_manifest(manifest)
         stats["embedding_cost"] = self._client.cost_tracker.to_dict()  # type: ignore[assignment]
         return stats
 
+    # ── schema sources ───────────────────────────────────────────────
+
+    @staticmethod
+    def _list_sources(schema_path: str) -> List[Tuple[str, int, int]]:
+        """``(source_key, mtime_ns, size)`` for every schema file under *schema_path*."""
+        if schema_path.startswith("s3://"):
+            bucket, prefix = _split_s3_uri(schema_path)
+            if prefix and not prefix.endswith("/"):
+                prefix += "/"
+            sources = []
+            pages = _s3_client().get_paginator("list_objects_v2").paginate(
+                Bucket=bucket, Prefix=prefix, Delimiter="/",
+            )
+            for page in pages:
+                for obj in page.get("Contents", []):
+                    name = obj["Key"][len(prefix):]
+                    if name.endswith(_SCHEMA_SUFFIXES) and not name.startswith("_"):
+                        sources.append((
+                            f"s3://{bucket}/{obj['Key']}",
+                            int(obj["LastModified"].timestamp() * 1e9),
+                            obj["Size"],
+                        ))
+            return sources
+
+        schema_dir = Path(schema_path)
+        if not schema_dir.exists():
+            raise FileNotFoundError(f"Schema directory not found: {schema_path}")
+        sources = []
+        for pattern in ("*.json", "*.json.gz"):
+            for f in schema_dir.glob(pattern):
+                if not f.name.startswith("_"):
+                    st = f.stat()
+                    sources.append((str(f.resolve()), st.st_mtime_ns, st.st_size))
+        return sources
+
+    @staticmethod
+    def _read_source(source: str) -> bytes:
+        if source.startswith("s3://"):
+            bucket, key = _split_s3_uri(source)
+            return _s3_client().get_object(Bucket=bucket, Key=key)["Body"].read()
+        # Unbuffered: readall() sizes one read() from fstat, so the file is
+        # copied straight into the result instead of through a BufferedReader.
+        with open(source, "rb", buffering=0) as f:
+            return f.readall()
+
+    @staticmethod
+    def _parse_source(source: str, raw: bytes) -> Dict[str, Any]:
+        if source.endswith(".gz"):
+            raw = gzip.decompress(raw)
+        return _loads(raw)
+
+    # ── graph-side schema versions ───────────────────────────────────
+
+    async def _read_versions(self) -> Dict[str, str]:
+        result = await self._client.graphiti.driver.execute_query(
+            "MATCH (v:_SchemaVersion {group_id: $group_id}) RETURN v.table AS table, v.hash AS hash",
+            group_id=self._client.group_id,
+        )
+        records = result[0] if result else []
+        return {r["table"]: r["hash"] for r in records}
+
+    async def _write_versions(self, versions: Dict[str, str]) -> None:
+        if not versions:
+            return
+        await self._client.graphiti.driver.execute_query(
+            """
+            UNWIND $rows AS r
+            MERGE (v:_SchemaVersion {table: r.table, group_id: $group_id})
+            SET v.hash = r.hash
+            """,
+            rows=[{"table": t, "hash": h} for t, h in versions.items()],
+            group_id=self._client.group_id,
+        )
+
+    # ── load manifest ────────────────────────────────────────────────
+
+    def _manifest_path(self) -> Path:
+        target = f"{self._client.host}:{self._client.port}/{self._client.group_id}"
+        return _CACHE_DIR / f"{hashlib.sha1(target.encode()).hexdigest()[:16]}.json"
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            return _loads(self._manifest_path().read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        path = self._manifest_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(_canonical_json(manifest))
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning("Could not persist schema load manifest %s: %s", path, e)
+
     async def _load_schema(
         self,
         schema_data: Dict,
         database: Optional[str] = None,
+        created_at: Optional[str] = None,
     ) -> Dict[str, int]:
+        nodes, edges, stats = self._collect_schema(schema_data, database)
+        await self._write_schema(nodes, edges, created_at=created_at)
+        return stats
+
+    def _collect_schema(
+        self,
+        schema_data: Dict,
+        database: Optional[str] = None,
+    ) -> Tuple[List[EntityNode], List[EntityEdge], Dict[str, int]]:
         stats = {
             "tables": 0, "columns": 0, "entities": 0,
             "edges": 0, "domains": 0, "codesets": 0,
@@ -90,6 +313,11 @@ class SchemaIndexer:
         table_name = schema_data["name"]
         db = schema_data.get("database", database or "default")
 
+        # Nodes and edges are collected first and written at the end with one
+        # UNWIND per label / relationship type instead of a round-trip each.
+        nodes: List[EntityNode] = []
+        edges: List[EntityEdge] = []
+
         # 1. Table node
         table_node = TableNode(
             name=table_name, database=db,
@@ -99,54 +327,61 @@ class SchemaIndexer:
             storage_format=schema_data.get("storage_format", ""),
             location=schema_data.get("location", ""),
         )
-        table_entity = await self._client.add_node(table_node.to_entity_node(group_id))
+        table_entity = table_node.to_entity_node(group_id)
+        nodes.append(table_entity)
         stats["tables"] += 1
 
         # 2. Column nodes + HAS_COLUMN edges
         column_uuid_map: Dict[str, str] = {}
+        partition_keys = set(table_node.partition_keys)
+        table_uuid = table_entity.uuid
         for idx, col in enumerate(schema_data.get("columns", [])):
+            col_name = col["name"]
+            # A column listed twice (e.g. also emitted as a partition key)
+            # would only add a duplicate node row, embedding and edge.
+            if col_name in column_uuid_map:
+                continue
+            get = col.get
             column_node = ColumnNode(
-                name=col["name"], table_name=table_name, database=db,
-                data_type=col.get("type", "string"),
-                description=col.get("description", ""),
-                is_primary_key=col.get("primary_key", False),
-                is_foreign_key=col.get("foreign_key", False),
-                is_partition=col["name"] in table_node.partition_keys,
-                is_nullable=col.get("nullable", True),
-                sample_values=col.get("sample_values", []),
+                name=col_name, table_name=table_name, database=db,
+                data_type=get("type", "string"),
+                description=get("description", ""),
+                is_primary_key=get("primary_key", False),
+                is_foreign_key=get("foreign_key", False),
+                is_partition=col_name in partition_keys,
+                is_nullable=get("nullable", True),
+                sample_values=get("sample_values", []),
             )
-            col_entity = await self._client.add_node(column_node.to_entity_node(group_id))
-            column_uuid_map[col["name"]] = col_entity.uuid
+            col_entity = column_node.to_entity_node(group_id)
+            nodes.append(col_entity)
+            column_uuid_map[col_name] = col_entity.uuid
             stats["columns"] += 1
 
             edge = HasColumnEdge(
                 table_name=table_name, database=db,
-                column_name=col["name"], ordinal_position=idx,
-            )
-            await self._client.add_edge(
-                edge.to_entity_edge(table_entity.uuid, col_entity.uuid, group_id)
+                column_name=col_name, ordinal_position=idx,
             )
+            edges.append(edge.to_entity_edge(table_uuid, col_entity.uuid, group_id))
             stats["edges"] += 1
 
             # CodeSet for coded columns
-            codes = col.get("codes")
+            codes = get("codes")
             if codes and isinstance(codes, dict):
                 codeset = CodeSetNode(
-                    name=f"codeset_{db}_{table_name}_{col['name']}",
-                    description=f"Code values for {table_name}.{col['name']}",
-                    codes=codes, column_name=col["name"],
+                    name=f"codeset_{db}_{table_name}_{col_name}",
+                    description=f"Code values for {table_name}.{col_name}",
+                    codes=codes, column_name=col_name,
                     table_name=table_name, database=db,
                 )
-                cs_entity = await self._client.add_node(codeset.to_entity_node(group_id))
+                cs_entity = codeset.to_entity_node(group_id)
+                nodes.append(cs_entity)
                 stats["codesets"] += 1
 
                 cs_edge = HasCodeSetEdge(
-                    column_name=col["name"], table_name=table_name,
+                    column_name=col_name, table_name=table_name,
                     database=db, codeset_name=codeset.name,
                 )
-                await self._client.add_edge(
-                    cs_edge.to_entity_edge(col_entity.uuid, cs_entity.uuid, group_id)
-                )
+                edges.append(cs_edge.to_entity_edge(col_entity.uuid, cs_entity.uuid, group_id))
                 stats["edges"] += 1
 
         # 3. BusinessEntity + ENTITY_MAPPING
@@ -164,18 +399,17 @@ class SchemaIndexer:
                 synonyms=entity_data.get("synonyms", []),
                 mapped_tables=[f"{db}.{table_name}"],
             )
-            business_entity_saved = await self._client.add_node(be_node.to_entity_node(group_id))
+            business_entity_saved = be_node.to_entity_node(group_id)
+            nodes.append(business_entity_saved)
             stats["entities"] += 1
 
             mapping_edge = EntityMappingEdge(
                 entity_name=entity_name, table_name=table_name,
                 database=db, confidence=1.0, mapping_type="direct",
             )
-            await self._client.add_edge(
-                mapping_edge.to_entity_edge(
-                    business_entity_saved.uuid, table_entity.uuid, group_id,
-                )
-            )
+            edges.append(mapping_edge.to_entity_edge(
+                business_entity_saved.uuid, table_entity.uuid, group_id,
+            ))
             stats["edges"] += 1
 
             # Column → BusinessEntity mapping for FK columns
@@ -185,13 +419,11 @@ class SchemaIndexer:
                         column_name=col["name"], table_name=table_name,
                         database=db, entity_name=entity_name, confidence=0.8,
                     )
-                    await self._client.add_edge(
-                        col_map.to_entity_edge(
-                            column_uuid_map[col["name"]],
-                            business_entity_saved.uuid,
-                            group_id,
-                        )
-                    )
+                    edges.append(col_map.to_entity_edge(
+                        column_uuid_map[col["name"]],
+                        business_entity_saved.uuid,
+                        group_id,
+                    ))
                     stats["edges"] += 1
 
         # 4. Domain node + edges
@@ -200,15 +432,14 @@ class SchemaIndexer:
                 name=domain_name,
                 description=f"Banking domain: {domain_name}",
             )
-            domain_saved = await self._client.add_node(domain_node.to_entity_node(group_id))
+            domain_saved = domain_node.to_entity_node(group_id)
+            nodes.append(domain_saved)
             stats["domains"] += 1
 
             btd_edge = BelongsToDomainEdge(
                 table_name=table_name, database=db, domain_name=domain_name,
             )
-            await self._client.add_edge(
-                btd_edge.to_entity_edge(table_entity.uuid, domain_saved.uuid, group_id)
-            )
+            edges.append(btd_edge.to_entity_edge(table_entity.uuid, domain_saved.uuid, group_id))
             stats["edges"] += 1
 
             if business_entity_saved:
@@ -216,11 +447,9 @@ class SchemaIndexer:
                     domain_name=domain_name,
                     entity_name=entity_data.get("name", table_name.title()),
                 )
-                await self._client.add_edge(
-                    ce_edge.to_entity_edge(
-                        domain_saved.uuid, business_entity_saved.uuid, group_id,
-                    )
-                )
+                edges.append(ce_edge.to_entity_edge(
+                    domain_saved.uuid, business_entity_saved.uuid, group_id,
+                ))
                 stats["edges"] += 1
 
         # 5. BusinessRules
@@ -234,7 +463,8 @@ class SchemaIndexer:
                 tables_involved=[f"{db}.{table_name}"],
                 columns_involved=rule_data.get("columns_involved", []),
             )
-            rule_saved = await self._client.add_node(rule_node.to_entity_node(group_id))
+            rule_saved = rule_node.to_entity_node(group_id)
+            nodes.append(rule_saved)
             stats["entities"] += 1
 
             at_edge = AppliesToEdge(
@@ -242,9 +472,7 @@ class SchemaIndexer:
                 target_name=f"{db}.{table_name}",
                 target_type="table",
             )
-            await self._client.add_edge(
-                at_edge.to_entity_edge(rule_saved.uuid, table_entity.uuid, group_id)
-            )
+            edges.append(at_edge.to_entity_edge(rule_saved.uuid, table_entity.uuid, group_id))
             stats["edges"] += 1
 
             if business_entity_saved:
@@ -252,11 +480,27 @@ class SchemaIndexer:
                     entity_name=entity_data.get("name", ""),
                     rule_name=rule_node.name,
                 )
-                await self._client.add_edge(
-                    hr_edge.to_entity_edge(
-                        business_entity_saved.uuid, rule_saved.uuid, group_id,
-                    )
-                )
+                edges.append(hr_edge.to_entity_edge(
+                    business_entity_saved.uuid, rule_saved.uuid, group_id,
+                ))
                 stats["edges"] += 1
 
-        return stats
+        return nodes, edges, stats
+
+    async def _write_schema(
+        self,
+        nodes: List[EntityNode],
+        edges: List[EntityEdge],
+        created_at: Optional[str] = None,
+    ) -> None:
+        # add_nodes folds nodes with a duplicate name onto one uuid; point
+        # edges built from the folded nodes at the surviving uuid.
+        original_uuids = [n.uuid for n in nodes]
+        await self._client.add_nodes(nodes, created_at=created_at)
+        remap = {old: n.uuid for old, n in zip(original_uuids, nodes) if old != n.uuid}
+        if remap:
+            for e in edges:
+                e.source_node_uuid = remap.get(e.source_node_uuid, e.source_node_uuid)
+                e.target_node_uuid = remap.get(e.target_node_uuid, e.target_node_uuid)
+        await self._client.add_edges(edges, created_at=created_at)
+        bump_schema_generation()
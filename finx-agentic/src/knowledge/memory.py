@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -81,10 +82,8 @@ class MemoryManager:
             description=description,
             partition_keys=partition_keys or [],
         )
-        table_entity = await self.entities.register_table(table)
-
-        for idx, col in enumerate(columns):
-            col_node = ColumnNode(
+        col_nodes = [
+            ColumnNode(
                 name=col["name"],
                 table_name=table_name,
                 database=database,
@@ -96,17 +95,23 @@ class MemoryManager:
                 is_nullable=col.get("nullable", True),
                 sample_values=col.get("sample_values", []),
             )
-            col_entity = await self.entities.register_column(col_node)
-
-            edge = HasColumnEdge(
-                table_name=table_name,
-                database=database,
-                column_name=col["name"],
-                ordinal_position=idx,
-            )
-            await self.entities.register_has_column(
-                edge, table_entity.uuid, col_entity.uuid
+            for col in columns
+        ]
+        # Table + columns in one bulk upsert, then all HAS_COLUMN edges in one.
+        table_entity, *col_entities = await self.entities.register_nodes([table, *col_nodes])
+        await self.entities.register_edges([
+            (
+                HasColumnEdge(
+                    table_name=table_name,
+                    database=database,
+                    column_name=col["name"],
+                    ordinal_position=idx,
+                ),
+                table_entity.uuid,
+                col_entity.uuid,
             )
+            for idx, (col, col_entity) in enumerate(zip(columns, col_entities))
+        ])
 
         return episode_id
 
@@ -201,18 +206,14 @@ class MemoryManager:
         database: Optional[str] = None,
         top_k: int = 5,
     ) -> Dict[str, Any]:
-        result = await self.search.schema_retrieval(
-            query, database=database, top_k=top_k,
-        )
-        schema_ctx = result.to_dict()
-        similar_queries = await self.episode_queries.search_similar_queries(
-            query, top_k=top_k,
-        )
-        feedback = await self.episode_queries.get_feedback_for_query(
-            query, limit=3,
+        # The three lookups share nothing, so they run concurrently.
+        result, similar_queries, feedback = await asyncio.gather(
+            self.search.schema_retrieval(query, database=database, top_k=top_k),
+            self.episode_queries.search_similar_queries(query, top_k=top_k),
+            self.episode_queries.get_feedback_for_query(query, limit=3),
         )
         return {
-            **schema_ctx,
+            **result.to_dict(),
             "similar_queries": similar_queries,
             "feedback": feedback,
         }
@@ -238,8 +239,9 @@ class MemoryManager:
         )
 
     async def get_stats(self) -> Dict[str, Any]:
-        entity_stats = await self.entity_queries.get_stats()
-        episode_stats = await self.episode_queries.get_stats()
+        entity_stats, episode_stats = await asyncio.gather(
+            self.entity_queries.get_stats(), self.episode_queries.get_stats(),
+        )
         return {"entities": entity_stats, "episodes": episode_stats}
 
     async def close(self) -> None:
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
 # ── models ───────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """A single search hit."""
 
@@ -20,10 +20,16 @@ class SearchResult:
     attributes: Dict = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "name": self.name,
+            "label": self.label,
+            "summary": self.summary,
+            "score": self.score,
+            "attributes": dict(self.attributes),
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TableContext:
     """Full context for a single table including columns, entities, joins, domain, rules and codesets."""
 
@@ -39,7 +45,18 @@ class TableContext:
     codesets: List[Dict[str, Any]] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "table": self.table,
+            "database": self.database,
+            "description": self.description,
+            "partition_keys": list(self.partition_keys),
+            "columns": list(self.columns),
+            "entities": list(self.entities),
+            "related_tables": list(self.related_tables),
+            "domain": self.domain,
+            "business_rules": list(self.business_rules),
+            "codesets": list(self.codesets),
+        }
 
 
 @dataclass
@@ -73,6 +90,8 @@ class SchemaSearchResult:
 from src.knowledge.retrieval.entity_queries import EntityQueries  # noqa: E402
 from src.knowledge.retrieval.episode_queries import EpisodeQueries  # noqa: E402
 from src.knowledge.retrieval.reranker import SearchReranker, ScoredItem, RerankerWeights  # noqa: E402
+from src.knowledge.retrieval.embedding_batcher import EmbeddingBatcher  # noqa: E402
+from src.knowledge.retrieval.semantic_cache import SemanticCache  # noqa: E402
 from src.knowledge.retrieval.schema_retrieval import SchemaRetrievalService  # noqa: E402
 
 __all__ = [
@@ -85,6 +104,9 @@ __all__ = [
     "SearchReranker",
     "ScoredItem",
     "RerankerWeights",
+    # caching / batching
+    "SemanticCache",
+    "EmbeddingBatcher",
     # models
     "SearchResult",
     "TableContext",
@@ -0,0 +1,83 @@
+"""EmbeddingBatcher — coalesce concurrent single-text embeddings into one call."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_Pending = List[Tuple[str, asyncio.Future]]
+
+
+class EmbeddingBatcher:
+    """Micro-batches ``embed()`` calls that arrive within *window_s* of each other.
+
+    The first request on an event loop arms a timer; every request queued
+    before it fires (or until *max_batch* is reached) is sent to the embedder
+    as a single ``create_batch`` call. Pending requests are tracked per event
+    loop because the retrieval path may run on several loops (see
+    ``GraphKnowledge.retrieve``).
+    """
+
+    def __init__(
+        self,
+        embedder: Callable[[], Any],
+        window_s: float = 0.002,
+        max_batch: int = 64,
+    ):
+        self._get_embedder = embedder
+        self.window_s = window_s
+        self.max_batch = max_batch
+        self._pending: Dict[asyncio.AbstractEventLoop, _Pending] = {}
+        self._timers: Dict[asyncio.AbstractEventLoop, asyncio.TimerHandle] = {}
+        # The loop only keeps weak references to tasks: hold in-flight batches
+        # here so one cannot be collected with its futures still pending.
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def embed(self, text: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        pending = self._pending.setdefault(loop, [])
+        pending.append((text, future))
+
+        if len(pending) >= self.max_batch:
+            self._flush(loop)
+        elif loop not in self._timers:
+            self._timers[loop] = loop.call_later(self.window_s, self._flush, loop)
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        timer = self._timers.pop(loop, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(loop, None)
+        if batch:
+            task = loop.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Pending) -> None:
+        texts = [text for text, _ in batch]
+        try:
+            embedder = self._get_embedder()
+            if len(texts) == 1:
+                vectors = [await embedder.create(input_data=texts)]
+            else:
+                try:
+                    vectors = await embedder.create_batch(texts)
+                except NotImplementedError:
+                    vectors = await asyncio.gather(
+                        *[embedder.create(input_data=[t]) for t in texts]
+                    )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        logger.debug("Embedded %d queries in one batch", len(texts))
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
@@ -2,19 +2,37 @@
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.knowledge.graph.client import GraphitiClient
+
+try:
+    import orjson
+except ImportError:  # optional: C JSON parser for attribute / content strings
+    orjson = None
+
+from src.knowledge.constants import JOIN_PATH_CACHE_SIZE, JOIN_PATH_TTL_S, TERM_INDEX_TTL_S
+from src.knowledge.graph.client import GraphitiClient, schema_generation
 from src.knowledge.graph.schemas.enums import NodeLabel
 
 logger = logging.getLogger(__name__)
 
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 class EntityQueries:
     """Read-only queries against entity / edge nodes."""
 
     def __init__(self, client: GraphitiClient):
         self._client = client
+        # lower-cased entity name / synonym -> resolve_term rows
+        self._term_index: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._term_index_loaded_at = 0.0
+        self._term_index_generation = schema_generation()
+        # (source, target, database, hops) -> (stored_at, path); table pairs recur
+        self._join_paths: "OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._join_paths_generation = schema_generation()
 
     @property
     def _driver(self):
@@ -48,7 +66,7 @@ class EntityQueries:
             "uuid": row["uuid"],
             "name": row["name"],
             "summary": row.get("summary", ""),
-            "attributes": json.loads(row["attributes"]) if row.get("attributes") else {},
+            "attributes": _loads(row["attributes"]) if row.get("attributes") else {},
         }
 
     # ── table lookups ────────────────────────────────────────────────
@@ -60,6 +78,7 @@ class EntityQueries:
             MATCH (t:Table)
             WHERE t.name = $name OR t.name CONTAINS $table_name
             RETURN t.uuid AS uuid, t.name AS name, t.summary AS summary, t.attributes AS attributes
+            ORDER BY CASE WHEN t.name = $name THEN 0 ELSE 1 END
             LIMIT 1
             """,
             name=name, table_name=table_name,
@@ -137,7 +156,7 @@ class EntityQueries:
         )
         return [
             {"name": r["name"], "summary": r.get("summary", ""),
-             "attributes": json.loads(r["attributes"]) if r.get("attributes") else {}}
+             "attributes": _loads(r["attributes"]) if r.get("attributes") else {}}
             for r in records
         ]
 
@@ -158,7 +177,7 @@ class EntityQueries:
         )
         return [
             {"name": r["name"], "summary": r.get("summary", ""), "score": float(r.get("score", 0)),
-             "attributes": json.loads(r["attributes"]) if r.get("attributes") else {}}
+             "attributes": _loads(r["attributes"]) if r.get("attributes") else {}}
             for r in records
         ]
 
@@ -179,6 +198,7 @@ class EntityQueries:
         records = await self._execute(
             """
             MATCH (d:Domain) WHERE toLower(d.name) = toLower($name)
+            WITH d LIMIT 1
             OPTIONAL MATCH (t:Table)-[:BELONGS_TO_DOMAIN]->(d)
             OPTIONAL MATCH (d)-[:CONTAINS_ENTITY]->(e:BusinessEntity)
             RETURN d.uuid AS uuid, d.name AS name, d.summary AS summary,
@@ -273,16 +293,58 @@ class EntityQueries:
 
     # ── business-term resolution ─────────────────────────────────────
 
+    async def _get_term_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        generation = schema_generation()
+        if (
+            self._term_index is None
+            or self._term_index_generation != generation
+            or time.monotonic() - self._term_index_loaded_at > TERM_INDEX_TTL_S
+        ):
+            records = await self._execute(
+                """
+                MATCH (e:BusinessEntity)
+                OPTIONAL MATCH (e)-[:ENTITY_MAPPING]->(t:Table)
+                RETURN e.name AS entity_name, e.summary AS description,
+                       e.attributes AS entity_attrs, collect(DISTINCT t.name) AS tables
+                """
+            )
+            index: Dict[str, List[Dict[str, Any]]] = {}
+            for r in records:
+                if not r.get("entity_name"):
+                    continue
+                row = self._term_row(r)
+                keys = {row["entity"].lower()}
+                keys.update(s.lower() for s in row["synonyms"] if isinstance(s, str))
+                for key in keys:
+                    index.setdefault(key, []).append(row)
+            self._term_index = index
+            self._term_index_loaded_at = time.monotonic()
+            self._term_index_generation = generation
+        return self._term_index
+
+    def invalidate_term_index(self) -> None:
+        self._term_index = None
+
     async def resolve_term(self, term: str) -> List[Dict[str, Any]]:
+        # Exact name / synonym hits are served from memory; anything else
+        # still goes through the attribute scan and then vector search.
+        hits = (await self._get_term_index()).get(term.lower())
+        if hits:
+            # Rows are shared by every key they are indexed under; hand out
+            # copies down to the lists so callers cannot edit the index.
+            return [
+                {**h, "synonyms": list(h["synonyms"]), "mapped_tables": list(h["mapped_tables"])}
+                for h in hits
+            ]
         records = await self._execute(
             """
             MATCH (e:BusinessEntity)
-            WHERE toLower(e.name) = toLower($term) OR e.attributes CONTAINS $term
+            WHERE toLower(e.name) = $term_norm OR e.attributes CONTAINS $term
             OPTIONAL MATCH (e)-[:ENTITY_MAPPING]->(t:Table)
             RETURN e.name AS entity_name, e.summary AS description,
                    e.attributes AS entity_attrs, collect(DISTINCT t.name) AS tables
             """,
-            term=term,
+            term=term, term_norm=term.lower(),
         )
         if records and records[0].get("entity_name"):
             return [self._term_row(r) for r in records]
@@ -314,6 +376,7 @@ class EntityQueries:
         records = await self._execute(
             """
             MATCH (t:Table) WHERE t.name = $name OR t.name CONTAINS $table_name
+            WITH t ORDER BY CASE WHEN t.name = $name THEN 0 ELSE 1 END LIMIT 1
             OPTIONAL MATCH (t)-[r:JOIN|FOREIGN_KEY]-(related:Table)
             OPTIONAL MATCH (e:BusinessEntity)-[:ENTITY_MAPPING]->(t)
             OPTIONAL MATCH (e)-[:ENTITY_MAPPING]->(sibling:Table) WHERE sibling <> t
@@ -329,7 +392,7 @@ class EntityQueries:
         relations: List[Dict[str, Any]] = []
         for rel in row.get("direct_relations", []):
             if rel.get("name"):
-                attrs = json.loads(rel["attributes"]) if rel.get("attributes") else {}
+                attrs = _loads(rel["attributes"]) if rel.get("attributes") else {}
                 relations.append({
                     "table": rel["name"], "relationship": rel.get("relationship", "RELATED"),
                     "join_type": attrs.get("join_type"), "join_condition": attrs.get("join_condition"),
@@ -342,6 +405,65 @@ class EntityQueries:
                 })
         return relations
 
+    async def find_join_path(
+        self, source: str, target: str, database: Optional[str] = None, max_hops: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """Shortest JOIN/FOREIGN_KEY chain between two tables, one hop per entry."""
+        hops = max(1, min(int(max_hops), 6))
+        generation = schema_generation()
+        if generation != self._join_paths_generation:
+            self._join_paths.clear()
+            self._join_paths_generation = generation
+        key = (source, target, database, hops)
+        hit = self._join_paths.get(key)
+        if hit is not None and time.monotonic() - hit[0] <= JOIN_PATH_TTL_S:
+            self._join_paths.move_to_end(key)
+            return [dict(h) for h in hit[1]]
+        path = await self._fetch_join_path(source, target, database, hops)
+        # "No path" is not cached: the missing JOIN may be registered next.
+        if not path or generation != schema_generation():
+            return path
+        self._join_paths[key] = (time.monotonic(), path)
+        self._join_paths.move_to_end(key)
+        if len(self._join_paths) > JOIN_PATH_CACHE_SIZE:
+            self._join_paths.popitem(last=False)
+        return [dict(h) for h in path]
+
+    def invalidate_join_paths(self) -> None:
+        self._join_paths.clear()
+
+    async def _fetch_join_path(
+        self, source: str, target: str, database: Optional[str], hops: int,
+    ) -> List[Dict[str, Any]]:
+        records = await self._execute(
+            f"""
+            MATCH (s:Table) WHERE s.name = $source_name OR s.name CONTAINS $source
+            WITH s ORDER BY CASE WHEN s.name = $source_name THEN 0 ELSE 1 END LIMIT 1
+            MATCH (t:Table) WHERE t.name = $target_name OR t.name CONTAINS $target
+            WITH s, t ORDER BY CASE WHEN t.name = $target_name THEN 0 ELSE 1 END LIMIT 1
+            WITH shortestPath((s)-[:JOIN|FOREIGN_KEY*1..{hops}]-(t)) AS p
+            WHERE p IS NOT NULL
+            RETURN [n IN nodes(p) | n.name] AS tables,
+                   [r IN relationships(p) | {{relationship: type(r), attributes: r.attributes}}] AS rels
+            """,
+            source=source, target=target,
+            source_name=f"{database}.{source}" if database else source,
+            target_name=f"{database}.{target}" if database else target,
+        )
+        if not records:
+            return []
+        row = records[0]
+        tables, rels = row.get("tables") or [], row.get("rels") or []
+        path: List[Dict[str, Any]] = []
+        for i, rel in enumerate(rels):
+            attrs = _loads(rel["attributes"]) if rel.get("attributes") else {}
+            path.append({
+                "from": tables[i], "to": tables[i + 1],
+                "relationship": rel.get("relationship", "RELATED"),
+                "join_type": attrs.get("join_type"), "join_condition": attrs.get("join_condition"),
+            })
+        return path
+
     async def search_entity_edges(self, table_name: str) -> List[Dict[str, Any]]:
         records = await self._execute(
             """
@@ -355,7 +477,7 @@ class EntityQueries:
         return [
             {"relationship": r.get("relationship"), "target": r.get("target_name"),
              "target_labels": r.get("target_labels", []),
-             "attributes": json.loads(r["attributes"]) if r.get("attributes") else {}}
+             "attributes": _loads(r["attributes"]) if r.get("attributes") else {}}
             for r in records if r.get("target_name")
         ]
 
@@ -384,7 +506,7 @@ class EntityQueries:
         )
         return [
             {"name": r["name"], "summary": r.get("summary", ""),
-             "attributes": json.loads(r["attributes"]) if r.get("attributes") else {}}
+             "attributes": _loads(r["attributes"]) if r.get("attributes") else {}}
             for r in records
         ]
 
@@ -402,7 +524,7 @@ class EntityQueries:
 
     @staticmethod
     def _term_row(row: Dict) -> Dict[str, Any]:
-        attrs = json.loads(row["entity_attrs"]) if row.get("entity_attrs") else {}
+        attrs = _loads(row["entity_attrs"]) if row.get("entity_attrs") else {}
         return {
             "entity": row.get("entity_name"),
             "description": row.get("description", ""),
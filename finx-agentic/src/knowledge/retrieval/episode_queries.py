@@ -4,11 +4,23 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
+
+try:
+    import orjson
+except ImportError:  # optional: C JSON parser for attribute / content strings
+    orjson = None
+
 from src.knowledge.graph.client import GraphitiClient
 from src.knowledge.graph.schemas.episodes import EpisodeCategory
 
 logger = logging.getLogger(__name__)
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Every episode writer emits json.dumps({"category": ..., ...}), so the
+# content opens with this prefix followed by the category value.
+_CATEGORY_PREFIX = json.dumps({"category": ""})[:-2]
+
 
 class EpisodeQueries:
     """Read-only queries against episodic memory in FalkorDB / Graphiti."""
@@ -51,13 +63,14 @@ class EpisodeQueries:
             RETURN e.uuid AS uuid, e.name AS name, e.content AS content,
                    e.source AS source, e.source_description AS source_description,
                    e.valid_at AS valid_at
+            LIMIT 1
             """,
             uuid=uuid,
         )
         if not records:
             return None
         row = records[0]
-        content = json.loads(row["content"]) if row.get("content") else {}
+        content = _loads(row["content"]) if row.get("content") else {}
         return {
             "uuid": row["uuid"],
             "name": row["name"],
@@ -161,22 +174,37 @@ class EpisodeQueries:
     # ── stats ────────────────────────────────────────────────────────
 
     async def get_stats(self) -> Dict[str, int]:
+        # Count per category server-side instead of shipping every episode's
+        # content here to json-decode it. The category is read from the
+        # anchored ``{"category": "`` prefix, so free-text fields cannot
+        # match; content in any other shape is returned and decoded here.
         records = await self._execute(
-            "MATCH (e:Episode {group_id: $group_id}) RETURN e.content AS content",
+            """
+            MATCH (e:Episode {group_id: $group_id})
+            WITH e.content AS content, e.content STARTS WITH $prefix AS anchored
+            WITH CASE WHEN anchored
+                      THEN split(right(content, size(content) - size($prefix)), '"')[0]
+                 END AS category,
+                 CASE WHEN anchored THEN null ELSE content END AS raw
+            RETURN category, raw, count(*) AS cnt
+            """,
             group_id=self._group_id,
+            prefix=_CATEGORY_PREFIX,
         )
         stats: Dict[str, int] = {}
         for r in records:
-            try:
-                cat = json.loads(r["content"]).get("category", "unknown")
-            except Exception:
-                cat = "unknown"
-            stats[cat] = stats.get(cat, 0) + 1
+            cat = r["category"]
+            if cat is None:
+                try:
+                    cat = _loads(r["raw"]).get("category", "unknown")
+                except Exception:
+                    cat = "unknown"
+            stats[cat] = stats.get(cat, 0) + r["cnt"]
         return stats
 
     @staticmethod
     def _row_to_dict(row: Dict) -> Dict[str, Any]:
-        content = json.loads(row["content"]) if row.get("content") else {}
+        content = _loads(row["content"]) if row.get("content") else {}
         return {
             "uuid": row.get("uuid"),
             "name": row.get("name"),
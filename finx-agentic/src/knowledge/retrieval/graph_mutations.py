@@ -5,7 +5,13 @@ import uuid as uuid_lib
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from src.knowledge.graph.client import GraphitiClient
+
+try:
+    import orjson
+except ImportError:  # optional: C JSON parser for attribute / content strings
+    orjson = None
+
+from src.knowledge.graph.client import GraphitiClient, bump_schema_generation, dump_attributes
 from src.knowledge.graph.cost_tracker import EmbeddingCall
 from src.knowledge.graph.schemas.enums import NodeLabel
 from src.knowledge.graph.schemas.edges.edge_types import EdgeType
@@ -13,6 +19,8 @@ from src.core.cost_tracker import estimate_cost
 
 logger = logging.getLogger(__name__)
 
+_loads = orjson.loads if orjson is not None else json.loads
+
 VALID_LABELS = {label.value for label in NodeLabel}
 VALID_EDGE_TYPES = {et.value for et in EdgeType}
 
@@ -71,7 +79,7 @@ class GraphMutations:
             "name": row["name"],
             "label": row.get("label", ""),
             "summary": row.get("summary", ""),
-            "attributes": json.loads(row["attributes"]) if row.get("attributes") else {},
+            "attributes": _loads(row["attributes"]) if row.get("attributes") else {},
             "created_at": row.get("created_at"),
         }
 
@@ -81,20 +89,20 @@ class GraphMutations:
             "uuid": row["uuid"],
             "edge_type": row.get("edge_type", ""),
             "fact": row.get("fact", ""),
-            "attributes": json.loads(row["attributes"]) if row.get("attributes") else {},
+            "attributes": _loads(row["attributes"]) if row.get("attributes") else {},
             "source_node": {
                 "uuid": row.get("source_uuid", ""),
                 "name": row.get("source_name", ""),
                 "label": row.get("source_label", ""),
                 "summary": row.get("source_summary", ""),
-                "attributes": json.loads(row["source_attributes"]) if row.get("source_attributes") else {},
+                "attributes": _loads(row["source_attributes"]) if row.get("source_attributes") else {},
             },
             "target_node": {
                 "uuid": row.get("target_uuid", ""),
                 "name": row.get("target_name", ""),
                 "label": row.get("target_label", ""),
                 "summary": row.get("target_summary", ""),
-                "attributes": json.loads(row["target_attributes"]) if row.get("target_attributes") else {},
+                "attributes": _loads(row["target_attributes"]) if row.get("target_attributes") else {},
             },
         }
 
@@ -148,6 +156,7 @@ class GraphMutations:
             MATCH (n:{label} {{uuid: $uuid, group_id: $group_id}})
             RETURN n.uuid AS uuid, n.name AS name, n.summary AS summary,
                    n.attributes AS attributes, n.created_at AS created_at
+            LIMIT 1
             """,
             uuid=node_uuid,
             group_id=self._group_id,
@@ -170,7 +179,7 @@ class GraphMutations:
 
         node_uuid = str(uuid_lib.uuid4())
         now = datetime.now(timezone.utc).isoformat()
-        attrs = json.dumps(attributes or {})
+        attrs = dump_attributes(attributes)
 
         start = time.monotonic()
         embedding = await self._embed(description) if description else []
@@ -196,6 +205,7 @@ class GraphMutations:
             created_at=now,
             embedding=embedding,
         )
+        bump_schema_generation()
 
         return {
             "uuid": node_uuid,
@@ -228,7 +238,7 @@ class GraphMutations:
             params["summary"] = description
         if attributes is not None:
             set_clauses.append("n.attributes = $attributes")
-            params["attributes"] = json.dumps(attributes)
+            params["attributes"] = dump_attributes(attributes)
 
         if not set_clauses:
             return await self.get_node(label, node_uuid)
@@ -257,6 +267,7 @@ class GraphMutations:
         )
 
         records = await self._execute(query, **params)
+        bump_schema_generation()
         if not records:
             return None
         node = self._parse_node(records[0])
@@ -276,6 +287,7 @@ class GraphMutations:
             uuid=node_uuid,
             group_id=self._group_id,
         )
+        bump_schema_generation()
         return bool(records)
 
     async def list_edges(
@@ -339,6 +351,7 @@ class GraphMutations:
                    target.uuid AS target_uuid, target.name AS target_name,
                    target.summary AS target_summary, target.attributes AS target_attributes,
                    head(labels(target)) AS target_label
+            LIMIT 1
             """,
             uuid=edge_uuid,
             group_id=self._group_id,
@@ -360,7 +373,7 @@ class GraphMutations:
 
         edge_uuid = str(uuid_lib.uuid4())
         now = datetime.now(timezone.utc).isoformat()
-        attrs = json.dumps(attributes or {})
+        attrs = dump_attributes(attributes)
 
         records = await self._execute(
             f"""
@@ -392,6 +405,7 @@ class GraphMutations:
             attributes=attrs,
             created_at=now,
         )
+        bump_schema_generation()
 
         if not records:
             raise ValueError("Source or target node not found")
@@ -411,7 +425,7 @@ class GraphMutations:
             params["fact"] = fact
         if attributes is not None:
             set_clauses.append("r.attributes = $attributes")
-            params["attributes"] = json.dumps(attributes)
+            params["attributes"] = dump_attributes(attributes)
 
         if not set_clauses:
             return await self.get_edge(edge_uuid)
@@ -431,6 +445,7 @@ class GraphMutations:
         )
 
         records = await self._execute(query, **params)
+        bump_schema_generation()
         if not records:
             return None
         return self._parse_edge(records[0])
@@ -446,6 +461,7 @@ class GraphMutations:
             uuid=edge_uuid,
             group_id=self._group_id,
         )
+        bump_schema_generation()
         return bool(records)
 
     async def explore_node(self, node_uuid: str) -> Optional[Dict[str, Any]]:
@@ -455,6 +471,7 @@ class GraphMutations:
             RETURN n.uuid AS uuid, n.name AS name, n.summary AS summary,
                    n.attributes AS attributes, n.created_at AS created_at,
                    head(labels(n)) AS label
+            LIMIT 1
             """,
             uuid=node_uuid,
             group_id=self._group_id,
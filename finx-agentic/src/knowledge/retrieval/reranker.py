@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import heapq
 import math
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 
@@ -28,7 +30,7 @@ class RerankerWeights:
             self.business_context /= total
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredItem:
     """A candidate search result with decomposed scores."""
 
@@ -94,19 +96,22 @@ class SearchReranker:
         thr = threshold if threshold is not None else self.confidence_threshold
         k = top_k if top_k is not None else self.top_k
 
+        # score and deduplicate by (label, name) in one pass
+        seen: dict[tuple, ScoredItem] = {}
         for item in items:
             self._compute_final_score(item)
-
-        # deduplicate by (name, label)
-        seen: dict[str, ScoredItem] = {}
-        for item in items:
-            key = f"{item.label}:{item.name}"
-            if key not in seen or item.final_score > seen[key].final_score:
+            key = (item.label, item.name)
+            best = seen.get(key)
+            if best is None or item.final_score > best.final_score:
                 seen[key] = item
 
-        filtered = [it for it in seen.values() if it.final_score >= thr]
-        filtered.sort(key=lambda it: it.final_score, reverse=True)
-        return filtered[:k]
+        # only the top k survive, so select them from a stream instead of
+        # materialising and fully sorting every candidate above threshold
+        return heapq.nlargest(
+            k,
+            (it for it in seen.values() if it.final_score >= thr),
+            key=attrgetter("final_score"),
+        )
 
     def _compute_final_score(self, item: ScoredItem) -> None:
         w = self.weights
@@ -1,18 +1,46 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional
-
-from src.knowledge.graph.client import GraphitiClient
-from src.knowledge.constants import DEFAULT_TOP_K, DEFAULT_SIMILARITY_THRESHOLD
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+try:
+    import orjson
+except ImportError:  # optional: C JSON parser for attribute / content strings
+    orjson = None
+
+from src.knowledge.graph.client import GraphitiClient, schema_generation
+from src.knowledge.constants import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    DEFAULT_TOP_K,
+    SEMANTIC_CACHE_SIZE,
+    SEMANTIC_CACHE_TTL_S,
+    TABLE_CONTEXT_CACHE_SIZE,
+    TABLE_CONTEXT_TTL_S,
+)
 from src.knowledge.retrieval.reranker import SearchReranker, ScoredItem, RerankerWeights
+from src.knowledge.retrieval.embedding_batcher import EmbeddingBatcher
+from src.knowledge.retrieval.semantic_cache import SemanticCache
 from src.knowledge.retrieval import SearchResult, TableContext, SchemaSearchResult
 
 logger = logging.getLogger(__name__)
 
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _loads_attrs(raw: str) -> Dict:
+    """Parse a node's JSON ``attributes`` string into a dict the caller owns."""
+    try:
+        parsed = _loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
 
 class SchemaRetrievalService:
 
@@ -25,6 +53,17 @@ class SchemaRetrievalService:
             confidence_threshold=0.5,
             top_k=10,
         )
+        self._semantic_cache = SemanticCache()
+        # Exact tier in front of the semantic cache: a repeated query (retry,
+        # multi-turn follow-up) is answered before L1 runs or it is embedded.
+        self._exact_cache: "OrderedDict[Hashable, Tuple[float, SchemaSearchResult]]" = OrderedDict()
+        # Table contexts recur across unrelated queries and only change on DDL.
+        self._context_cache: "OrderedDict[str, Tuple[float, TableContext]]" = OrderedDict()
+        self._generation = schema_generation()
+        # Cleared once the QueryPattern fulltext index turns out to be missing
+        # so later searches run only the substring scan.
+        self._pattern_fulltext = True
+        self._embed_batcher = EmbeddingBatcher(lambda: self._embedder)
 
     @property
     def _driver(self):
@@ -44,7 +83,26 @@ class SchemaRetrievalService:
 
     async def _embed_query(self, query: str) -> List[float]:
         text = query.replace("\n", " ").strip()
-        return await self._embedder.create(input_data=[text])
+        return await self._embed_batcher.embed(text)
+
+    def _exact_get(self, key: Hashable) -> Optional[SchemaSearchResult]:
+        hit = self._exact_cache.get(key)
+        if hit is None:
+            return None
+        stored_at, result = hit
+        if time.time() - stored_at > SEMANTIC_CACHE_TTL_S:
+            del self._exact_cache[key]
+            return None
+        self._exact_cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def _exact_put(self, key: Hashable, result: SchemaSearchResult) -> None:
+        # Callers own (and may mutate) what they are handed: the caches keep
+        # a private copy and every hit returns a fresh one.
+        self._exact_cache[key] = (time.time(), copy.deepcopy(result))
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > SEMANTIC_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
 
     @staticmethod
     def _parse_attrs(raw: Any) -> Dict:
@@ -52,10 +110,9 @@ class SchemaRetrievalService:
             return {}
         if isinstance(raw, dict):
             return raw
-        try:
-            return json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
+        if not isinstance(raw, str):
             return {}
+        return _loads_attrs(raw)
 
     async def _level1_exact_match(
         self, terms: List[str], database: Optional[str] = None,
@@ -65,7 +122,10 @@ class SchemaRetrievalService:
             return []
 
         search_terms = terms[:10]
-        params: Dict[str, Any] = {"terms": search_terms}
+        # Lower-case once here rather than per row on the server.
+        params: Dict[str, Any] = {
+            "terms": [{"text": t, "norm": t.lower()} for t in search_terms],
+        }
 
         entity_db_filter = ""
         table_db_filter = ""
@@ -79,61 +139,50 @@ class SchemaRetrievalService:
         if domain:
             entity_domain_filter = "AND e.attributes CONTAINS $domain"
             table_domain_filter = (
-                "AND (toLower(t.name) CONTAINS toLower($domain) "
+                "AND (toLower(t.name) CONTAINS $domain_norm "
                 "OR t.attributes CONTAINS $domain)"
             )
             params["domain"] = domain
+            params["domain_norm"] = domain.lower()
 
-        entity_coro = self._execute(
+        # Entity and table matches share one round-trip; rows are tagged by
+        # ``kind`` and each UNION branch keeps its own LIMIT.
+        records = await self._execute(
             f"""
             UNWIND $terms AS term
             MATCH (e:BusinessEntity)
-            WHERE (toLower(e.name) CONTAINS toLower(term)
-               OR e.attributes CONTAINS term)
+            WHERE (toLower(e.name) CONTAINS term.norm
+               OR e.attributes CONTAINS term.text)
             {entity_db_filter}
             {entity_domain_filter}
-            RETURN DISTINCT e.name AS name, e.summary AS summary,
-                   e.attributes AS attributes
+            RETURN DISTINCT 'BusinessEntity' AS kind, e.name AS name,
+                   e.summary AS summary, e.attributes AS attributes
             LIMIT 20
-            """,
-            **params,
-        )
-
-        table_coro = self._execute(
-            f"""
+            UNION ALL
             UNWIND $terms AS term
             MATCH (t:Table)
-            WHERE toLower(t.name) CONTAINS toLower(term)
+            WHERE toLower(t.name) CONTAINS term.norm
             {table_db_filter}
             {table_domain_filter}
-            RETURN DISTINCT t.name AS name, t.summary AS summary,
-                   t.attributes AS attributes
+            RETURN DISTINCT 'Table' AS kind, t.name AS name,
+                   t.summary AS summary, t.attributes AS attributes
             LIMIT 20
             """,
             **params,
         )
 
-        entity_records, table_records = await asyncio.gather(entity_coro, table_coro)
-
-        items: List[ScoredItem] = []
-        for r in entity_records:
-            items.append(ScoredItem(
-                name=r["name"], label="BusinessEntity",
-                summary=r.get("summary") or "",
-                attributes=self._parse_attrs(r.get("attributes")),
-                text_match_score=1.0, graph_relevance_score=1.0,
-                match_type="exact", hop_distance=0, source_level="level1",
-            ))
-        for r in table_records:
-            items.append(ScoredItem(
-                name=r["name"], label="Table",
+        # Entities first, then tables, as the reranker has always seen them.
+        records.sort(key=lambda r: r["kind"] != "BusinessEntity")
+        return [
+            ScoredItem(
+                name=r["name"], label=r["kind"],
                 summary=r.get("summary") or "",
                 attributes=self._parse_attrs(r.get("attributes")),
                 text_match_score=1.0, graph_relevance_score=1.0,
                 match_type="exact", hop_distance=0, source_level="level1",
-            ))
-
-        return items
+            )
+            for r in records
+        ]
 
     async def _level2_graph_expansion(
         self, l1_items: List[ScoredItem], max_hops: int = 2,
@@ -213,18 +262,7 @@ class SchemaRetrievalService:
 
     async def _level3_pattern_match(self, query: str) -> List[ScoredItem]:
         items: List[ScoredItem] = []
-        records = await self._execute(
-            """
-            MATCH (qp:QueryPattern)
-            WHERE toLower(qp.summary) CONTAINS toLower($query)
-               OR toLower(qp.name) CONTAINS toLower($query)
-            OPTIONAL MATCH (qp)-[:QUERY_USES_TABLE]->(t:Table)
-            RETURN qp.name AS name, qp.summary AS summary,
-                   qp.attributes AS attrs, collect(DISTINCT t.name) AS tables
-            LIMIT 10
-            """,
-            query=query,
-        )
+        records = await self._pattern_candidates(query)
         for r in records:
             attrs = self._parse_attrs(r.get("attrs"))
             items.append(ScoredItem(
@@ -240,6 +278,63 @@ class SchemaRetrievalService:
             ))
         return items
 
+    async def _pattern_candidates(self, query: str) -> List[Dict]:
+        # Substring hits come first and keep the baseline recall (fulltext
+        # does not split ``monthly_revenue_by_branch`` on ``_``); the
+        # QueryPattern fulltext index (see GraphitiClient.initialize) only
+        # fills the remaining slots with word matches. Both run concurrently.
+        ft_query = (
+            self._driver.build_fulltext_query(query, [self._client.group_id])
+            if self._pattern_fulltext else ""
+        )
+        if not ft_query:
+            return await self._pattern_substring(query)
+        substring_rows, fulltext_rows = await asyncio.gather(
+            self._pattern_substring(query), self._pattern_fulltext_rows(ft_query),
+        )
+        seen = {r["name"] for r in substring_rows}
+        merged = substring_rows + [r for r in fulltext_rows if r["name"] not in seen]
+        return merged[:10]
+
+    async def _pattern_substring(self, query: str) -> List[Dict]:
+        # Top 10 are chosen before the table expansion, name hits first.
+        return await self._execute(
+            """
+            MATCH (qp:QueryPattern)
+            WHERE toLower(qp.summary) CONTAINS $query_norm
+               OR toLower(qp.name) CONTAINS $query_norm
+            WITH qp, CASE WHEN toLower(qp.name) CONTAINS $query_norm THEN 0 ELSE 1 END AS rank
+            ORDER BY rank, qp.name
+            LIMIT 10
+            OPTIONAL MATCH (qp)-[:QUERY_USES_TABLE]->(t:Table)
+            RETURN qp.name AS name, qp.summary AS summary,
+                   qp.attributes AS attrs, collect(DISTINCT t.name) AS tables, rank
+            ORDER BY rank, name
+            """,
+            query_norm=query.lower(),
+        )
+
+    async def _pattern_fulltext_rows(self, ft_query: str) -> List[Dict]:
+        try:
+            return await self._execute(
+                """
+                CALL db.idx.fulltext.queryNodes('QueryPattern', $ft_query)
+                YIELD node AS qp, score
+                WITH qp, score
+                ORDER BY score DESC
+                LIMIT 10
+                OPTIONAL MATCH (qp)-[:QUERY_USES_TABLE]->(t:Table)
+                RETURN qp.name AS name, qp.summary AS summary,
+                       qp.attributes AS attrs, collect(DISTINCT t.name) AS tables, score
+                ORDER BY score DESC
+                """,
+                ft_query=ft_query,
+            )
+        except Exception as e:
+            self._pattern_fulltext = False
+            logger.debug("QueryPattern fulltext search unavailable: %s", e)
+            return []
+
     async def _level4_vector_search(
         self, embedding: List[float], *,
         top_k: int = DEFAULT_TOP_K,
@@ -293,13 +388,12 @@ class SchemaRetrievalService:
 
         table_items = [it for it in items if it.label == "Table"]
         if table_items:
-            contexts = await asyncio.gather(
-                *[self._get_table_context(it.name) for it in table_items]
-            )
-            for it, ctx in zip(table_items, contexts):
+            contexts = await self._get_table_contexts([it.name for it in table_items])
+            for it in table_items:
+                ctx = contexts.get(it.name)
                 if ctx is None:
                     continue
-                it.context = ctx.to_dict()
+                it.context = copy.deepcopy(ctx.to_dict())
                 col_count = len(ctx.columns)
                 described = sum(1 for c in ctx.columns if c.get("description"))
                 it.data_quality_score = SearchReranker.compute_data_quality(
@@ -387,15 +481,19 @@ class SchemaRetrievalService:
             WHERE n.embedding IS NOT NULL {db_clause}
             WITH n, (2 - vec.cosineDistance(n.embedding, vecf32($embedding))) / 2 AS score
             WHERE score >= $threshold
-            RETURN n.name AS name, n.summary AS summary, n.attributes AS attributes, score
+            RETURN n.name AS name, coalesce(n.summary, '') AS summary,
+                   n.attributes AS attributes, score
             ORDER BY score DESC LIMIT $top_k
             """,
             **params,
         )
+        # Filtering and ordering happen server-side; rows are consumed as-is.
+        SR = SearchResult
+        parse = self._parse_attrs
         return [
-            SearchResult(
-                name=r["name"], label=label, summary=r["summary"] or "",
-                score=float(r["score"]), attributes=self._parse_attrs(r["attributes"]),
+            SR(
+                name=r["name"], label=label, summary=r["summary"],
+                score=r["score"], attributes=parse(r["attributes"]),
             )
             for r in records
         ]
@@ -414,6 +512,19 @@ class SchemaRetrievalService:
         include_context: bool = True,
     ) -> SchemaSearchResult:
         t0 = time.time()
+        self._sync_generation()
+        generation = self._generation
+
+        cache_key = (
+            top_k, threshold, database, tuple(entities or ()), intent, domain,
+            tuple(business_terms or ()), tuple(column_hints or ()),
+            include_patterns, include_context,
+        )
+        exact_key = (" ".join(query.lower().split()), cache_key)
+        cached = self._exact_get(exact_key)
+        if cached is not None:
+            logger.debug("schema_retrieval exact cache hit for %r", query[:80])
+            return cached
 
         db = database
         search_terms: List[str] = list(entities or [])
@@ -450,6 +561,11 @@ class SchemaRetrievalService:
             needs_embedding = run_vector_search
             if needs_embedding:
                 embedding = await self._embed_query(query)
+                cached = self._semantic_cache.get(embedding, cache_key)
+                if cached is not None:
+                    logger.debug("schema_retrieval semantic cache hit for %r", query[:80])
+                    self._exact_put(exact_key, cached)
+                    return copy.deepcopy(cached)
 
             deeper_coros = []
             if run_graph_expansion:
@@ -520,10 +636,11 @@ class SchemaRetrievalService:
         context: List[Dict[str, Any]] = []
         if include_context:
             table_names = self._collect_table_names(tables, columns, entities_out)
-            raw_contexts = await asyncio.gather(
-                *[self._get_table_context(name) for name in table_names]
-            )
-            context = [ctx.to_dict() for ctx in raw_contexts if ctx is not None]
+            raw_contexts = await self._get_table_contexts(table_names)
+            context = [
+                copy.deepcopy(raw_contexts[name].to_dict())
+                for name in table_names if name in raw_contexts
+            ]
 
         # Determine which levels actually ran
         levels: List[str] = ["L1"]
@@ -539,7 +656,7 @@ class SchemaRetrievalService:
         logger.debug("schema_retrieval completed in %dms — tables=%d columns=%d entities=%d",
                       elapsed_ms, len(tables), len(columns), len(entities_out))
 
-        return SchemaSearchResult(
+        result = SchemaSearchResult(
             tables=tables, columns=columns, entities=entities_out,
             patterns=patterns, context=context,
             ranked_results=[it.to_dict() for it in ranked],
@@ -562,98 +679,131 @@ class SchemaRetrievalService:
                 "fallback_domains": fallback_domains,
             },
         )
-
-
-    async def _get_table_context(self, table_name: str) -> Optional[TableContext]:
+        # Skip the put when a schema write landed while this search ran.
+        if generation == schema_generation():
+            if embedding is not None:
+                self._semantic_cache.put(embedding, copy.deepcopy(result), cache_key)
+            self._exact_put(exact_key, result)
+        return result
+
+    def invalidate_caches(self) -> None:
+        """Drop cached search results and table contexts."""
+        self._exact_cache.clear()
+        self._semantic_cache.clear()
+        self._context_cache.clear()
+        self._pattern_fulltext = True
+
+    def _sync_generation(self) -> None:
+        generation = schema_generation()
+        if generation != self._generation:
+            self._generation = generation
+            self.invalidate_caches()
+
+    async def _get_table_contexts(self, table_names: List[str]) -> Dict[str, TableContext]:
+        """Fetch contexts for several tables in one round-trip, keyed by name."""
+        self._sync_generation()
+        contexts: Dict[str, TableContext] = {}
+        missing: List[str] = []
+        now = time.time()
+        for name in table_names:
+            hit = self._context_cache.get(name)
+            if hit is not None and now - hit[0] <= TABLE_CONTEXT_TTL_S:
+                self._context_cache.move_to_end(name)
+                contexts[name] = hit[1]
+            else:
+                missing.append(name)
+        if not missing:
+            return contexts
         records = await self._execute(
             """
-            MATCH (t:Table {name: $name})
-            OPTIONAL MATCH (t)-[:HAS_COLUMN]->(c:Column)
-            OPTIONAL MATCH (e:BusinessEntity)-[:ENTITY_MAPPING]->(t)
-            OPTIONAL MATCH (t)-[rel:JOIN|FOREIGN_KEY]-(related:Table)
-            OPTIONAL MATCH (t)-[:BELONGS_TO_DOMAIN]->(d:Domain)
-            OPTIONAL MATCH (rule:BusinessRule)-[:APPLIES_TO]->(t)
-            OPTIONAL MATCH (c)-[:HAS_CODESET]->(cs:CodeSet)
-            RETURN t.name        AS table_name,
+            UNWIND $names AS name
+            MATCH (t:Table {name: name})
+            RETURN name          AS requested,
+                   t.name        AS table_name,
                    t.summary     AS description,
                    t.attributes  AS table_attrs,
-                   collect(DISTINCT {name: c.name, summary: c.summary, attributes: c.attributes}) AS columns,
-                   collect(DISTINCT {name: e.name, summary: e.summary, attributes: e.attributes}) AS entities,
-                   collect(DISTINCT {name: related.name, relationship: type(rel), attributes: rel.attributes}) AS relations,
-                   d.name AS domain_name,
-                   collect(DISTINCT {name: rule.name, summary: rule.summary, attributes: rule.attributes}) AS rules,
-                   collect(DISTINCT {name: cs.name, summary: cs.summary, attributes: cs.attributes}) AS codesets
+                   [(t)-[:HAS_COLUMN]->(c:Column)
+                     | {name: c.name, summary: c.summary, attributes: c.attributes}] AS columns,
+                   [(t)-[:HAS_COLUMN]->(:Column)-[:HAS_CODESET]->(cs:CodeSet)
+                     | {name: cs.name, summary: cs.summary, attributes: cs.attributes}] AS codesets,
+                   [(e:BusinessEntity)-[:ENTITY_MAPPING]->(t)
+                     | {name: e.name, summary: e.summary, attributes: e.attributes}] AS entities,
+                   [(t)-[rel:JOIN|FOREIGN_KEY]-(related:Table)
+                     | {name: related.name, relationship: type(rel), attributes: rel.attributes}] AS relations,
+                   [(rule:BusinessRule)-[:APPLIES_TO]->(t)
+                     | {name: rule.name, summary: rule.summary, attributes: rule.attributes}] AS rules,
+                   head([(t)-[:BELONGS_TO_DOMAIN]->(d:Domain) | d.name]) AS domain_name
             """,
-            name=table_name,
+            names=missing,
         )
-        if not records:
-            return None
+        for row in records:
+            # A name shared across databases matches several tables; keep the first.
+            name = row["requested"]
+            if name not in contexts:
+                ctx = contexts[name] = self._build_table_context(row)
+                self._context_cache[name] = (now, ctx)
+                self._context_cache.move_to_end(name)
+        while len(self._context_cache) > TABLE_CONTEXT_CACHE_SIZE:
+            self._context_cache.popitem(last=False)
+        return contexts
+
+    def _build_table_context(self, row: Dict[str, Any]) -> TableContext:
+        parse = self._parse_attrs
+        table_attrs = parse(row["table_attrs"])
+
+        columns = [
+            {
+                "name": (ca := parse(col["attributes"])).get("column_name", col["name"]),
+                "type": ca.get("data_type", ""),
+                "description": col["summary"] or "",
+                "is_primary_key": ca.get("is_primary_key", False),
+                "is_foreign_key": ca.get("is_foreign_key", False),
+                "is_partition": ca.get("is_partition", False),
+                "is_nullable": ca.get("is_nullable", True),
+            }
+            for col in row["columns"]
+        ]
 
-        row = records[0]
-        table_attrs = self._parse_attrs(row["table_attrs"])
-
-        columns = []
-        for col in row.get("columns", []):
-            if not col.get("name"):
-                continue
-            col_attrs = self._parse_attrs(col.get("attributes"))
-            columns.append({
-                "name": col_attrs.get("column_name", col["name"]),
-                "type": col_attrs.get("data_type", ""),
-                "description": col.get("summary", "") or "",
-                "is_primary_key": col_attrs.get("is_primary_key", False),
-                "is_foreign_key": col_attrs.get("is_foreign_key", False),
-                "is_partition": col_attrs.get("is_partition", False),
-                "is_nullable": col_attrs.get("is_nullable", True),
-            })
-
-        entities_list = []
-        for ent in row.get("entities", []):
-            if not ent.get("name"):
-                continue
-            ent_attrs = self._parse_attrs(ent.get("attributes"))
-            entities_list.append({
+        entities_list = [
+            {
                 "name": ent["name"],
-                "domain": ent_attrs.get("domain", ""),
-                "synonyms": ent_attrs.get("synonyms", []),
-                "description": ent.get("summary", "") or "",
-            })
-
-        related_tables = []
-        for rel in row.get("relations", []):
-            if not rel.get("name"):
-                continue
-            rel_attrs = self._parse_attrs(rel.get("attributes"))
-            related_tables.append({
+                "domain": (ea := parse(ent["attributes"])).get("domain", ""),
+                "synonyms": ea.get("synonyms", []),
+                "description": ent["summary"] or "",
+            }
+            for ent in row["entities"]
+        ]
+
+        related_tables = [
+            {
                 "table": rel["name"],
-                "relationship": rel.get("relationship", "RELATED"),
-                "join_type": rel_attrs.get("join_type"),
-                "join_condition": rel_attrs.get("join_condition"),
-            })
-
-        business_rules = []
-        for rule in row.get("rules", []):
-            if not rule.get("name"):
-                continue
-            rule_attrs = self._parse_attrs(rule.get("attributes"))
-            business_rules.append({
+                "relationship": rel["relationship"] or "RELATED",
+                "join_type": (ra := parse(rel["attributes"])).get("join_type"),
+                "join_condition": ra.get("join_condition"),
+            }
+            for rel in row["relations"]
+        ]
+
+        business_rules = [
+            {
                 "name": rule["name"],
-                "description": rule.get("summary", "") or "",
-                "rule_type": rule_attrs.get("rule_type", ""),
-                "expression": rule_attrs.get("expression", ""),
-            })
-
-        codesets = []
-        for cs in row.get("codesets", []):
-            if not cs.get("name"):
-                continue
-            cs_attrs = self._parse_attrs(cs.get("attributes"))
-            codesets.append({
+                "description": rule["summary"] or "",
+                "rule_type": (rua := parse(rule["attributes"])).get("rule_type", ""),
+                "expression": rua.get("expression", ""),
+            }
+            for rule in row["rules"]
+        ]
+
+        # A codeset shared by several columns is reached once per column.
+        codesets = [
+            {
                 "name": cs["name"],
-                "description": cs.get("summary", "") or "",
-                "codes": cs_attrs.get("codes", {}),
-                "column_name": cs_attrs.get("column_name", ""),
-            })
+                "description": cs["summary"] or "",
+                "codes": (csa := parse(cs["attributes"])).get("codes", {}),
+                "column_name": csa.get("column_name", ""),
+            }
+            for cs in {cs["name"]: cs for cs in row["codesets"]}.values()
+        ]
 
         return TableContext(
             table=table_attrs.get("table_name", row["table_name"]),
@@ -0,0 +1,100 @@
+"""SemanticCache — bounded in-memory cache keyed by query embedding."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import simsimd
+except ImportError:  # optional: SIMD cosine kernels
+    simsimd = None
+
+from src.knowledge.constants import (
+    SEMANTIC_CACHE_SIZE,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL_S,
+)
+
+
+_DTYPE = np.float16 if simsimd is not None else np.float32
+
+
+class SemanticCache:
+    """Ring buffer of ``(embedding, key, value, timestamp)`` entries.
+
+    Embeddings are stored L2-normalised in a contiguous matrix so a lookup is
+    a single batched cosine pass: SimSIMD over ``float16`` rows when the
+    package is installed, otherwise one BLAS gemv over ``float32``. A hit
+    requires cosine similarity >= *threshold*, an entry younger than *ttl_s*
+    and an equal *key* (the search options the value was computed with).
+    """
+
+    def __init__(
+        self,
+        max_size: int = SEMANTIC_CACHE_SIZE,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl_s: float = SEMANTIC_CACHE_TTL_S,
+    ):
+        self.max_size = max_size
+        self.threshold = threshold
+        self.ttl_s = ttl_s
+        self.clear()
+
+    def clear(self) -> None:
+        self._matrix: Optional[np.ndarray] = None
+        self._keys: List[Optional[Hashable]] = [None] * self.max_size
+        self._values: List[Any] = [None] * self.max_size
+        self._timestamps = np.zeros(self.max_size, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @staticmethod
+    def _normalise(embedding: Sequence[float]) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        return (vec / norm if norm else vec).astype(_DTYPE, copy=False)
+
+    def _similarities(self, query: np.ndarray) -> np.ndarray:
+        rows = self._matrix[: self._count]
+        if simsimd is not None:
+            dist = np.asarray(simsimd.cdist(rows, query[None, :], metric="cosine"))
+            return 1.0 - dist[:, 0]
+        return rows @ query
+
+    def get(self, embedding: Sequence[float], key: Hashable = None) -> Optional[Any]:
+        if not self._count or self._matrix is None:
+            return None
+        query = self._normalise(embedding)
+        if query.shape[0] != self._matrix.shape[1]:
+            return None
+
+        sims = self._similarities(query)
+        candidates = np.flatnonzero(sims >= self.threshold)
+        if not candidates.size:
+            return None
+
+        cutoff = time.time() - self.ttl_s
+        for idx in candidates[np.argsort(sims[candidates])[::-1]]:
+            if self._timestamps[idx] >= cutoff and self._keys[idx] == key:
+                return self._values[idx]
+        return None
+
+    def put(self, embedding: Sequence[float], value: Any, key: Hashable = None) -> None:
+        vec = self._normalise(embedding)
+        if self._matrix is None or self._matrix.shape[1] != vec.shape[0]:
+            self.clear()
+            self._matrix = np.zeros((self.max_size, vec.shape[0]), dtype=_DTYPE)
+
+        slot = self._next
+        self._matrix[slot] = vec
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._timestamps[slot] = time.time()
+        self._next = (slot + 1) % self.max_size
+        self._count = min(self._count + 1, self.max_size)
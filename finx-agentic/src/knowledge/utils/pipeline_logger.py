@@ -3,32 +3,62 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import contextvars
 import functools
 import inspect
+import itertools
 import json
 import logging
+import os
 import re
-import time
 import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Type
+from time import perf_counter_ns, time_ns
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+try:
+    import orjson
+except ImportError:  # optional: C JSON encoder for argument/result previews
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[3]
 _DEFAULT_LOG_DIR = _PROJECT_ROOT / "scripts" / "log_process"
 
-_active_log: contextvars.ContextVar[Optional["_LogWriter"]] = contextvars.ContextVar(
-    "_active_log", default=None,
-)
+# Read once at import: FINX_DISABLE_PIPELINE_LOG=1 turns @track_class into a no-op.
+_ENABLED = os.getenv("FINX_DISABLE_PIPELINE_LOG", "").strip().lower() not in ("1", "true", "yes")
 
-# Track call depth for indented nested calls
-_call_depth: contextvars.ContextVar[int] = contextvars.ContextVar(
-    "_call_depth", default=0,
+# (active writer, call depth) packed into one ContextVar: one get per call and
+# one set/reset pair per tracked call instead of two of each.
+_state: contextvars.ContextVar[Tuple[Optional["_LogWriter"], int]] = contextvars.ContextVar(
+    "_pipe_state", default=(None, 0),
 )
 
+# Single background writer so log flushes never block the traced call.
+_LOG_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipe-log")
+atexit.register(_LOG_EXECUTOR.shutdown, wait=True)
+
+_SEP = b"=" * 90 + b"\n"
+_NL = b"\n"
+_INDENT_UNIT = "│   "
+_INDENTS = tuple(_INDENT_UNIT * i for i in range(32))
+_TS_TEMPLATE = "[+{:6d}.{}ms] "
+_FN_COUNTER = itertools.count()
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTS)
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str, ensure_ascii=False).encode("utf-8")
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  PUBLIC API — the decorator
@@ -42,6 +72,9 @@ def track_class(
     entry_point: Optional[str] = None,
 ):
     """Class decorator that wraps every method with detailed step-by-step logging."""
+    if not _ENABLED:
+        return cls if cls is not None else (lambda klass: klass)
+
     resolved_dir = Path(log_dir) if log_dir else _DEFAULT_LOG_DIR
     skip = exclude or set()
 
@@ -57,14 +90,24 @@ def track_class(
 
         klass.__init__ = new_init
 
-        for name, method in list(inspect.getmembers(klass, predicate=inspect.isfunction)):
-            if name.startswith("__") or name in skip:
-                continue
-            raw = klass.__dict__.get(name)
-            if isinstance(raw, (staticmethod, classmethod)):
-                continue
-            wrapped = _wrap_method(name, method, entry_point)
-            setattr(klass, name, wrapped)
+        # Walk the MRO so inherited methods are traced too; the first class
+        # defining a name wins, as in attribute lookup. staticmethod and
+        # classmethod objects are not plain functions and are left alone, as
+        # are methods a decorated base class already wrapped.
+        seen: Set[str] = set()
+        for base in klass.__mro__[:-1]:
+            for name, method in list(base.__dict__.items()):
+                if name in seen:
+                    continue
+                seen.add(name)
+                if (
+                    name.startswith("__") or name in skip
+                    or not inspect.isfunction(method)
+                    or getattr(method, "_pipeline_tracked", False)
+                ):
+                    continue
+                wrapped = _wrap_method(name, method, entry_point)
+                setattr(klass, name, wrapped)
 
         return klass
 
@@ -77,94 +120,146 @@ def track_class(
 #  INTERNAL — method wrapper
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def _wrap_method(name: str, method: Callable, entry_point: Optional[str]) -> Callable:
-    is_entry = (entry_point is None and not name.startswith("_")) or name == entry_point
-    sig = inspect.signature(method)
-
-    if asyncio.iscoroutinefunction(method):
-        @functools.wraps(method)
-        async def async_wrapper(self, *args, **kwargs):
-            writer = _active_log.get()
-            created_here = False
-            depth = _call_depth.get()
-
-            if writer is None and is_entry:
-                query_val = _extract_query(args, kwargs, sig)
-                writer = _LogWriter(
-                    class_name=self._track_class_name,
-                    query=query_val,
-                    log_dir=self._track_log_dir,
-                )
-                _active_log.set(writer)
-                created_here = True
+class _TrackedMethod:
+    """Per-method tracking metadata plus the shared enter/exit/error logic.
 
-            if writer is None:
-                return await method(self, *args, **kwargs)
+    Both the sync and async wrappers delegate to one instance, so the step
+    bookkeeping lives in a single place and each wrapper closure only
+    captures the spec, the target and its entry flag.
+    """
 
-            args_summary = _summarize_args(args, kwargs, sig)
-            step_num = writer.next_step()
-            writer.enter(self._track_class_name, name, args_summary, depth, step_num)
+    __slots__ = ("name", "is_entry", "param_names", "offset", "target", "is_coro")
 
-            _call_depth.set(depth + 1)
-            t0 = time.time()
-            try:
-                result = await method(self, *args, **kwargs)
-                dt = time.time() - t0
-                result_detail = _detailed_result(result, name)
-                writer.exit(self._track_class_name, name, dt, result_detail, depth, step_num)
-                return result
-            except Exception as exc:
-                writer.error(self._track_class_name, name, time.time() - t0, exc, depth)
-                raise
-            finally:
-                _call_depth.set(depth)
-                if created_here:
-                    writer.close()
-                    _active_log.set(None)
+    def __init__(self, name: str, method: Callable, entry_point: Optional[str]):
+        self.name = name
+        self.is_entry = (entry_point is None and not name.startswith("_")) or name == entry_point
+        self.param_names = tuple(inspect.signature(method).parameters)
+        self.offset = 1 if self.param_names and self.param_names[0] == "self" else 0
+        self.target = method
+        self.is_coro = asyncio.iscoroutinefunction(method)
 
-        return async_wrapper
-    else:
-        @functools.wraps(method)
-        def sync_wrapper(self, *args, **kwargs):
-            writer = _active_log.get()
-            created_here = False
-            depth = _call_depth.get()
+    # Logging must never fail the traced call: every hook below swallows its
+    # own errors, and ``begin`` returns None so the wrapper runs untracked.
 
-            if writer is None and is_entry:
-                query_val = _extract_query(args, kwargs, sig)
+    def begin(self, instance: Any, state: Tuple[Optional["_LogWriter"], int],
+              args: tuple, kwargs: dict) -> Optional[tuple]:
+        try:
+            writer, depth = state
+            created_here = writer is None
+            if created_here:
                 writer = _LogWriter(
-                    class_name=self._track_class_name,
-                    query=query_val,
-                    log_dir=self._track_log_dir,
+                    class_name=instance._track_class_name,
+                    query=_extract_query(args, kwargs),
+                    log_dir=instance._track_log_dir,
                 )
-                _active_log.set(writer)
-                created_here = True
-
-            if writer is None:
-                return method(self, *args, **kwargs)
 
-            args_summary = _summarize_args(args, kwargs, sig)
+            args_summary = _summarize_args(args, kwargs, self.param_names, self.offset)
             step_num = writer.next_step()
-            writer.enter(self._track_class_name, name, args_summary, depth, step_num)
+            writer.enter(instance._track_class_name, self.name, args_summary, depth, step_num)
+        except Exception as exc:
+            logger.debug("Pipeline log skipped for %s: %s", self.name, exc)
+            return None
+        token = _state.set((writer, depth + 1))
+        return writer, created_here, depth, step_num, token
 
-            _call_depth.set(depth + 1)
-            t0 = time.time()
+    def done(self, instance: Any, writer: "_LogWriter", result: Any, dt_ns: int,
+             depth: int, step_num: int) -> None:
+        try:
+            result_detail = _detailed_result(result, self.name)
+            writer.exit(
+                instance._track_class_name, self.name, dt_ns, result_detail, depth, step_num,
+            )
+        except Exception as exc:
+            logger.debug("Pipeline log exit failed for %s: %s", self.name, exc)
+
+    def failed(self, instance: Any, writer: "_LogWriter", exc: Exception, dt_ns: int,
+               depth: int) -> None:
+        try:
+            writer.error(instance._track_class_name, self.name, dt_ns, exc, depth)
+        except Exception as log_exc:
+            logger.debug("Pipeline log error entry failed for %s: %s", self.name, log_exc)
+
+    @staticmethod
+    def end(writer: "_LogWriter", created_here: bool, token: contextvars.Token) -> None:
+        _state.reset(token)
+        if created_here:
             try:
-                result = method(self, *args, **kwargs)
-                dt = time.time() - t0
-                result_detail = _detailed_result(result, name)
-                writer.exit(self._track_class_name, name, dt, result_detail, depth, step_num)
-                return result
+                writer.close()
+            except Exception as exc:
+                logger.debug("Pipeline log close failed: %s", exc)
+
+
+def _wrap_method(name: str, method: Callable, entry_point: Optional[str]) -> Callable:
+    """Build a wrapper specialised at decoration time for sync/async and entry/non-entry.
+
+    Entry methods always open (or join) a log, so their wrapper goes straight
+    to the tracked path. Non-entry methods only log inside an active pipeline,
+    so their wrapper is a single ContextVar read and a pass-through call when
+    nothing is being traced. Neither variant tests ``is_entry`` per call.
+    """
+    spec = _TrackedMethod(name, method, entry_point)
+    get_state = _state.get
+
+    if spec.is_coro:
+        async def tracked(self, state, args, kwargs):
+            ctx = spec.begin(self, state, args, kwargs)
+            if ctx is None:
+                return await method(self, *args, **kwargs)
+            writer, created_here, depth, step_num, token = ctx
+            t0 = perf_counter_ns()
+            try:
+                result = await method(self, *args, **kwargs)
             except Exception as exc:
-                writer.error(self._track_class_name, name, time.time() - t0, exc, depth)
+                spec.failed(self, writer, exc, perf_counter_ns() - t0, depth)
                 raise
+            else:
+                spec.done(self, writer, result, perf_counter_ns() - t0, depth, step_num)
+                return result
             finally:
-                _call_depth.set(depth)
-                if created_here:
-                    writer.close()
-                    _active_log.set(None)
+                spec.end(writer, created_here, token)
+
+        if spec.is_entry:
+            async def async_wrapper(self, *args, **kwargs):
+                return await tracked(self, get_state(), args, kwargs)
+        else:
+            async def async_wrapper(self, *args, **kwargs):
+                state = get_state()
+                if state[0] is None:
+                    return await method(self, *args, **kwargs)
+                return await tracked(self, state, args, kwargs)
+
+        async_wrapper._pipeline_tracked = True
+        return functools.wraps(method)(async_wrapper)
+
+    def tracked(self, state, args, kwargs):
+        ctx = spec.begin(self, state, args, kwargs)
+        if ctx is None:
+            return method(self, *args, **kwargs)
+        writer, created_here, depth, step_num, token = ctx
+        t0 = perf_counter_ns()
+        try:
+            result = method(self, *args, **kwargs)
+        except Exception as exc:
+            spec.failed(self, writer, exc, perf_counter_ns() - t0, depth)
+            raise
+        else:
+            spec.done(self, writer, result, perf_counter_ns() - t0, depth, step_num)
+            return result
+        finally:
+            spec.end(writer, created_here, token)
 
-        return sync_wrapper
+    if spec.is_entry:
+        def sync_wrapper(self, *args, **kwargs):
+            return tracked(self, get_state(), args, kwargs)
+    else:
+        def sync_wrapper(self, *args, **kwargs):
+            state = get_state()
+            if state[0] is None:
+                return method(self, *args, **kwargs)
+            return tracked(self, state, args, kwargs)
+
+    sync_wrapper._pipeline_tracked = True
+    return functools.wraps(method)(sync_wrapper)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -172,92 +267,134 @@ def _wrap_method(name: str, method: Callable, entry_point: Optional[str]) -> Cal
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 class _LogWriter:
-    """Accumulates detailed log lines and flushes to file on close."""
+    """Accumulates detailed log lines as UTF-8 bytes and flushes to file on close."""
 
-    __slots__ = ("_lines", "_t0", "_filepath", "_closed", "_step_counter")
+    __slots__ = ("_buf", "_t0_ns", "_filepath", "_closed", "_step_counter")
 
     def __init__(self, class_name: str, query: str, log_dir: Path):
-        self._t0 = time.time()
+        self._t0_ns = perf_counter_ns()
         self._closed = False
         self._step_counter = 0
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         slug = _slugify(query)[:50]
-        self._filepath = log_dir / f"{ts}_{class_name}_{slug}.log"
-        self._lines: List[str] = [
-            "=" * 90,
-            f"  PIPELINE LOG — {class_name}",
-            f"  Query   : {query}",
-            f"  Started : {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}",
-            "=" * 90,
-            "",
-        ]
+        self._filepath = log_dir / f"{_file_stamp()}_{class_name}_{slug}.log"
+        self._buf = bytearray(_SEP)
+        self._line(f"  PIPELINE LOG — {class_name}")
+        self._line(f"  Query   : {query}")
+        self._line(f"  Started : {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}")
+        self._buf += _SEP
+        self._buf += _NL
+
+    def _line(self, text: str) -> None:
+        self._buf += text.encode("utf-8")
+        self._buf += _NL
 
     def next_step(self) -> int:
         self._step_counter += 1
         return self._step_counter
 
     def _ts(self) -> str:
-        return f"+{(time.time() - self._t0) * 1000:8.1f}ms"
+        tenths = (perf_counter_ns() - self._t0_ns) // 100_000
+        return _TS_TEMPLATE.format(tenths // 10, tenths % 10)
 
-    def _indent(self, depth: int) -> str:
-        return "│   " * depth
+    @staticmethod
+    def _indent(depth: int) -> str:
+        return _INDENTS[depth] if depth < 32 else _INDENT_UNIT * depth
 
     def enter(self, cls: str, method: str, args_summary: Dict[str, Any],
               depth: int, step: int) -> None:
         ind = self._indent(depth)
-        self._lines.append(
-            f"[{self._ts()}] {ind}┌─ STEP {step}: {cls}.{method}()"
-        )
+        self._line(f"{self._ts()}{ind}┌─ STEP {step}: {cls}.{method}()")
         if args_summary:
             for k, v in args_summary.items():
-                self._lines.append(f"           {ind}│  ▸ {k} = {v}")
+                self._line(f"           {ind}│  ▸ {k} = {v}")
 
-    def exit(self, cls: str, method: str, dt: float, result_detail: List[str],
+    def exit(self, cls: str, method: str, dt_ns: int, result_detail: List[str],
              depth: int, step: int) -> None:
         ind = self._indent(depth)
-        dt_ms = dt * 1000
         if result_detail:
             for line in result_detail:
-                self._lines.append(f"           {ind}│  {line}")
-        self._lines.append(
-            f"[{self._ts()}] {ind}└─ DONE  {cls}.{method}() ⏱ {dt_ms:.1f}ms"
-        )
-        self._lines.append("")
+                self._line(f"           {ind}│  {line}")
+        self._line(f"{self._ts()}{ind}└─ DONE  {cls}.{method}() ⏱ {_fmt_ms(dt_ns)}ms")
+        self._buf += _NL
 
-    def error(self, cls: str, method: str, dt: float, exc: Exception,
+    def error(self, cls: str, method: str, dt_ns: int, exc: Exception,
               depth: int) -> None:
         ind = self._indent(depth)
-        self._lines.append(
-            f"[{self._ts()}] {ind}└─ ✖ ERROR {cls}.{method}() ⏱ {dt * 1000:.1f}ms"
-        )
-        self._lines.append(f"           {ind}   {type(exc).__name__}: {exc}")
-        for line in traceback.format_exception(type(exc), exc, exc.__traceback__):
-            for sub in line.rstrip().split("\n"):
-                self._lines.append(f"           {ind}   ! {sub}")
-        self._lines.append("")
+        self._line(f"{self._ts()}{ind}└─ ✖ ERROR {cls}.{method}() ⏱ {_fmt_ms(dt_ns)}ms")
+        self._line(f"           {ind}   {type(exc).__name__}: {exc}")
+        tb = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
+        prefix = f"           {ind}   ! ".encode("utf-8")
+        self._buf += prefix
+        self._buf += tb.rstrip("\n").encode("utf-8").replace(_NL, _NL + prefix)
+        self._buf += _NL
+        self._buf += _NL
 
     def close(self) -> None:
         if self._closed:
             return
         self._closed = True
-        total_ms = round((time.time() - self._t0) * 1000)
-        self._lines.append("")
-        self._lines.append("=" * 90)
-        self._lines.append(f"  FINISHED : {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}")
-        self._lines.append(f"  TOTAL    : {total_ms}ms  ({self._step_counter} steps)")
-        self._lines.append("=" * 90)
-        try:
-            self._filepath.parent.mkdir(parents=True, exist_ok=True)
-            self._filepath.write_text("\n".join(self._lines) + "\n", encoding="utf-8")
-            logger.info("📋 Pipeline log → %s", self._filepath)
-        except Exception as exc:
-            logger.warning("Failed to write pipeline log: %s", exc)
+        total_ms = (perf_counter_ns() - self._t0_ns) // 1_000_000
+        self._buf += _NL
+        self._buf += _SEP
+        self._line(f"  FINISHED : {datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')}")
+        self._line(f"  TOTAL    : {total_ms}ms  ({self._step_counter} steps)")
+        self._buf += _SEP
+        _submit_log_write(self._filepath, bytes(self._buf), "📋 Pipeline log → %s")
+
+
+def _fmt_ms(ns: int) -> str:
+    """Format a nanosecond duration as milliseconds with one decimal, integer-only."""
+    tenths = ns // 100_000
+    return f"{tenths // 10}.{tenths % 10}"
+
+
+def _submit_log_write(
+    path: Path, data: bytes, done_msg: str, level: int = logging.INFO,
+) -> None:
+    """Hand a finished log buffer to the background writer thread."""
+    try:
+        _LOG_EXECUTOR.submit(_flush_log_file, path, data, done_msg, level)
+    except RuntimeError:  # executor already shut down (interpreter exit)
+        _flush_log_file(path, data, done_msg, level)
+
+
+def _flush_log_file(path: Path, data: bytes, done_msg: str, level: int) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_file(path, data)
+        logger.log(level, done_msg, path)
+    except Exception as exc:
+        logger.warning("Failed to write log %s: %s", path, exc)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write *data* to *path* with a single open/write/close."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  DETAILED RESULT FORMATTERS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# (field, format, only when > 0) — ScoredItem score columns in display order.
+_SCORE_FORMATS = (
+    ("final_score", "final={:.3f}", False),
+    ("text_match_score", "text={:.2f}", False),
+    ("graph_relevance_score", "graph={:.2f}", False),
+    ("data_quality_score", "quality={:.2f}", True),
+    ("business_context_score", "biz={:.2f}", True),
+)
+_ITEM_FIELDS = ("name", "label", "match_type", "source_level", "hop_distance") + tuple(
+    key for key, _, _ in _SCORE_FORMATS
+)
+
+
 def _detailed_result(result: Any, method_name: str) -> List[str]:
     """Return multiple lines describing the result in detail."""
     lines: List[str] = []
@@ -274,39 +411,26 @@ def _detailed_result(result: Any, method_name: str) -> List[str]:
 
         first = result[0]
 
-        # ScoredItem (from reranker or level methods)
-        if hasattr(first, "name") and hasattr(first, "label"):
-            by_label: Dict[str, list] = {}
+        # ScoredItem / SearchResult (slotted dataclasses, no instance dict) —
+        # pull just the fields the summary prints.
+        if not isinstance(first, dict) and hasattr(first, "name") and hasattr(first, "label"):
+            by_label: Dict[str, list] = defaultdict(list)
             for item in result:
-                lbl = getattr(item, "label", "?")
-                by_label.setdefault(lbl, []).append(item)
+                d = {k: getattr(item, k, None) for k in _ITEM_FIELDS}
+                by_label[d["label"] or "?"].append(d)
             for lbl, items in by_label.items():
                 lines.append(f"   ├─ {lbl}: {len(items)} items")
-                for item in items[:10]:
-                    name = getattr(item, "name", "?")
-                    score = getattr(item, "final_score", None)
-                    text_sc = getattr(item, "text_match_score", None)
-                    graph_sc = getattr(item, "graph_relevance_score", None)
-                    data_q = getattr(item, "data_quality_score", None)
-                    biz_ctx = getattr(item, "business_context_score", None)
-                    level = getattr(item, "source_level", "")
-                    match_type = getattr(item, "match_type", "")
-                    hop = getattr(item, "hop_distance", "")
-                    parts = []
-                    if score is not None:
-                        parts.append(f"final={score:.3f}")
-                    if text_sc is not None:
-                        parts.append(f"text={text_sc:.2f}")
-                    if graph_sc is not None:
-                        parts.append(f"graph={graph_sc:.2f}")
-                    if data_q is not None and data_q > 0:
-                        parts.append(f"quality={data_q:.2f}")
-                    if biz_ctx is not None and biz_ctx > 0:
-                        parts.append(f"biz={biz_ctx:.2f}")
-                    score_str = ", ".join(parts)
+                for d in items[:10]:
+                    hop = d.get("hop_distance") or ""
+                    score_str = ", ".join(
+                        fmt.format(v)
+                        for key, fmt, positive_only in _SCORE_FORMATS
+                        if (v := d.get(key)) is not None and (not positive_only or v > 0)
+                    )
                     hop_str = f" hop={hop}" if hop else ""
                     lines.append(
-                        f"   │  • {name}  [{match_type}/{level}{hop_str}]  ({score_str})"
+                        f"   │  • {d.get('name', '?')}  "
+                        f"[{d.get('match_type') or ''}/{d.get('source_level') or ''}{hop_str}]  ({score_str})"
                     )
             return lines
 
@@ -385,14 +509,21 @@ def _detailed_result(result: Any, method_name: str) -> List[str]:
 #  HELPERS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+def _file_stamp() -> str:
+    """Sortable, collision-free filename stamp: epoch seconds, nanoseconds, sequence."""
+    ns = time_ns()
+    return f"{ns // 1_000_000_000}_{ns % 1_000_000_000:09d}_{next(_FN_COUNTER)}"
+
+
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[\s_]+")
+
+
 def _slugify(text: str) -> str:
-    text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "_", text)
-    return text.strip("_") or "unknown"
+    return _SLUG_DASH.sub("_", _SLUG_STRIP.sub("", text.lower().strip())).strip("_") or "unknown"
 
 
-def _extract_query(args: tuple, kwargs: dict, sig: inspect.Signature) -> str:
+def _extract_query(args: tuple, kwargs: dict) -> str:
     if "query" in kwargs:
         return str(kwargs["query"])[:200]
     if args:
@@ -400,13 +531,14 @@ def _extract_query(args: tuple, kwargs: dict, sig: inspect.Signature) -> str:
     return "unknown"
 
 
-def _summarize_args(args: tuple, kwargs: dict, sig: inspect.Signature) -> Dict[str, Any]:
+def _summarize_args(
+    args: tuple, kwargs: dict, param_names: tuple, offset: int,
+) -> Dict[str, Any]:
     summary: Dict[str, Any] = {}
-    params = list(sig.parameters.values())
-    offset = 1 if params and params[0].name == "self" else 0
+    n_params = len(param_names)
     for i, arg in enumerate(args):
         idx = i + offset
-        name = params[idx].name if idx < len(params) else f"arg{i}"
+        name = param_names[idx] if idx < n_params else f"arg{i}"
         if name == "embedding":
             summary[name] = f"vec[{len(arg)}]" if isinstance(arg, list) else _compact(arg)
         else:
@@ -419,6 +551,22 @@ def _summarize_args(args: tuple, kwargs: dict, sig: inspect.Signature) -> Dict[s
     return summary
 
 
+def _compact_json(obj: Any, max_len: int) -> str:
+    """Serialize a small container in one C-level pass, truncated to *max_len* bytes.
+
+    Anything the encoder rejects (circular references, oversized integers,
+    ...) falls back to a truncated ``repr``, which handles self-references.
+    """
+    try:
+        b = _dumps(obj)
+    except (TypeError, ValueError):
+        s = repr(obj)
+        return s[:max_len] + "…" if len(s) > max_len else s
+    if len(b) <= max_len:
+        return b.decode("utf-8")
+    return b[:max_len].decode("utf-8", "ignore") + "…"
+
+
 def _compact(obj: Any, max_len: int = 150) -> Any:
     if obj is None:
         return None
@@ -430,11 +578,11 @@ def _compact(obj: Any, max_len: int = 150) -> Any:
         if not obj:
             return "[]"
         if len(obj) <= 8:
-            return [_compact(x, 60) for x in obj]
+            return _compact_json(obj, max_len)
         return f"[{_compact(obj[0], 40)}, … ({len(obj)} total)]"
     if isinstance(obj, dict):
         if len(obj) <= 5:
-            return {k: _compact(v, 60) for k, v in obj.items()}
+            return _compact_json(obj, max_len)
         keys = list(obj.keys())[:5]
         return f"dict({len(obj)} keys: {keys}…)"
     if hasattr(obj, "name"):
@@ -1,25 +1,16 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, Template
 from functools import lru_cache
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
 
 class PromptManager:
 
-    _instance: Optional["PromptManager"] = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     def __init__(self):
-        if hasattr(self, "_initialized"):
-            return
-        self._initialized = True
         self.templates_dir = Path(__file__).parent / "templates"
         self.env = Environment(
             loader=FileSystemLoader(self.templates_dir),
@@ -33,9 +24,22 @@ class PromptManager:
     def get_template(self, template_path: str) -> Template:
         return self.env.get_template(template_path)
 
+    @lru_cache(maxsize=256)
+    def _render_cached(self, template_path: str, frozen_vars: tuple) -> str:
+        return self.get_template(template_path).render(**dict(frozen_vars))
+
     def render(self, template_path: str, **variables) -> str:
-        template = self.get_template(template_path)
-        return template.render(**variables)
+        # Agent builds render the same templates with the same (usually no)
+        # variables; memoise the output when the variables are hashable.
+        key = tuple(sorted(variables.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return self.get_template(template_path).render(**variables)
+        return self._render_cached(template_path, key)
+
+    def render_many(self, template_paths: Sequence[str], **variables) -> Dict[str, str]:
+        return {path: self.render(path, **variables) for path in template_paths}
 
     def render_as_list(self, template_path: str, **variables) -> List[str]:
         rendered = self.render(template_path, **variables)
@@ -46,5 +50,14 @@ class PromptManager:
         return "\n".join(f"{prefix}{item}" for item in items)
 
 
+_MANAGER: Optional[PromptManager] = None
+_LOCK = threading.Lock()
+
+
 def get_prompt_manager() -> PromptManager:
-    return PromptManager()
+    global _MANAGER
+    if _MANAGER is None:
+        with _LOCK:
+            if _MANAGER is None:
+                _MANAGER = PromptManager()
+    return _MANAGER
@@ -16,13 +16,15 @@ def _get_db_url() -> str:
     return os.getenv("POSTGRES_URL", DEFAULT_DB_URL)
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=None)
 def get_postgres_db(
     session_table: Optional[str] = None,
     memory_table: Optional[str] = None,
 ) -> PostgresDb:
     db_url = _get_db_url()
-    logger.info("Initialising PostgresDb url=%s", db_url.split("@")[-1])
+    if logger.isEnabledFor(logging.INFO):
+        # host/db part only — never log credentials
+        logger.info("Initialising PostgresDb url=%s", db_url.rpartition("@")[2])
     return PostgresDb(
         db_url=db_url,
         session_table=session_table or "finx_sessions",
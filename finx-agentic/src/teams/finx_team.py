@@ -6,15 +6,21 @@ from typing import Optional
 from agno.agent import Agent
 from agno.db.base import BaseDb
 from agno.team import Team
+from agno.utils.message import render_instructions
 
 from src.agents.knowledge import create_knowledge_agent
 from src.agents.sql_generator import create_sql_generator_agent
 from src.agents.chart_builder import create_chart_builder_agent
 from src.core.model_factory import create_model
 from src.knowledge.graph.client import GraphitiClient
+from src.prompts.manager import get_prompt_manager
 
 logger = logging.getLogger(__name__)
 
+KNOWLEDGE_TEMPLATE = "knowledge/instructions.jinja2"
+SQL_GENERATOR_TEMPLATE = "sql_generator/instructions.jinja2"
+CHART_BUILDER_TEMPLATE = "chart_builder/instructions.jinja2"
+
 TEAM_INSTRUCTIONS = [
     "You are FinX — a friendly, knowledgeable banking data assistant.",
     "You help users explore, understand, and get insights from their banking data.",
@@ -79,6 +85,10 @@ TEAM_INSTRUCTIONS = [
     "- Celebrate interesting findings: 'Wow, chi nhánh HCM chiếm tới 45% tổng user! 🏆'",
 ]
 
+# Rendered once at import exactly as Team would render the list on every run;
+# a single string is passed through to the system message untouched.
+TEAM_INSTRUCTIONS_TEXT = render_instructions(TEAM_INSTRUCTIONS)
+
 
 def build_finx_team(
     graphiti_client: GraphitiClient,
@@ -87,20 +97,27 @@ def build_finx_team(
     region_name: str = "ap-southeast-1",
     db: Optional[BaseDb] = None,
 ) -> Team:
+    instructions = get_prompt_manager().render_many(
+        [KNOWLEDGE_TEMPLATE, SQL_GENERATOR_TEMPLATE, CHART_BUILDER_TEMPLATE]
+    )
+
     knowledge_agent = create_knowledge_agent(
         graphiti_client=graphiti_client,
         default_database=database,
         db=db,
+        instructions=instructions[KNOWLEDGE_TEMPLATE],
     )
 
     sql_generator_agent = create_sql_generator_agent(
         database=database,
         output_location=output_location,
         region_name=region_name,
+        instructions=instructions[SQL_GENERATOR_TEMPLATE],
     )
 
     chart_builder_agent = create_chart_builder_agent(
         db=db,
+        instructions=instructions[CHART_BUILDER_TEMPLATE],
     )
 
     return Team(
@@ -115,7 +132,7 @@ def build_finx_team(
             sql_generator_agent,
             chart_builder_agent,
         ],
-        instructions=TEAM_INSTRUCTIONS,
+        instructions=TEAM_INSTRUCTIONS_TEXT,
         db=db,
         enable_session_summaries=True,
         share_member_interactions=True,
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional
@@ -41,9 +42,27 @@ class GraphSearchTools(Toolkit):
             self.store_feedback,
             self.store_pattern,
             self.get_memory_stats,
+            self.batch_lookup,
         ]
         super().__init__(name="graph_search_tools", tools=tools, **kwargs)
 
+        # Read-only tools batch_lookup may dispatch to; writes stay single calls.
+        self._batchable = {
+            fn.__name__: fn
+            for fn in (
+                self.schema_retrieval,
+                self.get_table_details,
+                self.get_table_columns,
+                self.resolve_business_term,
+                self.find_related_tables,
+                self.find_join_path,
+                self.get_query_patterns,
+                self.get_similar_queries,
+                self.get_recent_queries,
+                self.discover_domains,
+            )
+        }
+
     async def schema_retrieval(
         self,
         query: str,
@@ -69,9 +88,11 @@ class GraphSearchTools(Toolkit):
 
     async def get_table_details(self, table_name: str, database: Optional[str] = None) -> str:
         db = database or self.default_database
-        table_info = await self.entity_registry.get_table(table_name, db)
-        columns = await self.entity_registry.get_columns_for_table(table_name, db)
-        edges = await self.entity_registry.search_entity_edges(table_name)
+        table_info, columns, edges = await asyncio.gather(
+            self.entity_registry.get_table(table_name, db),
+            self.entity_registry.get_columns_for_table(table_name, db),
+            self.entity_registry.search_entity_edges(table_name),
+        )
         return json.dumps({
             "table": table_info,
             "columns": columns,
@@ -94,8 +115,11 @@ class GraphSearchTools(Toolkit):
 
     async def find_join_path(self, source_table: str, target_table: str, database: Optional[str] = None) -> str:
         db = database or self.default_database
-        source_rels = await self.entity_registry.find_related_tables(source_table, db)
-        target_rels = await self.entity_registry.find_related_tables(target_table, db)
+        source_rels, target_rels, join_path = await asyncio.gather(
+            self.entity_registry.find_related_tables(source_table, db),
+            self.entity_registry.find_related_tables(target_table, db),
+            self.entity_registry.find_join_path(source_table, target_table, db),
+        )
 
         direct = [
             r for r in source_rels
@@ -111,13 +135,16 @@ class GraphSearchTools(Toolkit):
             "target": target_table,
             "direct_joins": direct,
             "shared_intermediates": list(shared),
+            "join_path": join_path,
             "source_relations": source_rels,
             "target_relations": target_rels,
         }, default=str, ensure_ascii=False)
 
     async def get_query_patterns(self, query: str) -> str:
-        patterns = await self.entity_registry.search_patterns(query)
-        similar = await self.episode_store.search_similar_queries(query, top_k=3)
+        patterns, similar = await asyncio.gather(
+            self.entity_registry.search_patterns(query),
+            self.episode_store.search_similar_queries(query, top_k=3),
+        )
         return json.dumps({
             "patterns": patterns,
             "similar_queries": similar,
@@ -138,6 +165,30 @@ class GraphSearchTools(Toolkit):
         domains = await self.search_service._fallback_domain_discovery()
         return json.dumps({"domains": domains}, default=str, ensure_ascii=False)
 
+    async def batch_lookup(self, invocations: List[Dict[str, Any]]) -> str:
+        """Run several independent lookups at once.
+
+        Each invocation is ``{"tool_name": ..., "arguments": {...}}`` naming one
+        of the read-only tools in this toolkit. Results come back in the same
+        order; prefer this over separate calls when you need two or more
+        lookups that do not depend on each other.
+        """
+
+        async def _run(inv: Dict[str, Any]) -> Any:
+            name = inv.get("tool_name", "")
+            fn = self._batchable.get(name)
+            if fn is None:
+                return {"tool_name": name, "error": f"unknown or non-batchable tool: {name}"}
+            try:
+                raw = await fn(**(inv.get("arguments") or {}))
+                return {"tool_name": name, "result": json.loads(raw)}
+            except Exception as e:
+                logger.warning("batch_lookup %s failed: %s", name, e)
+                return {"tool_name": name, "error": str(e)}
+
+        results = await asyncio.gather(*[_run(inv) for inv in invocations])
+        return json.dumps(results, default=str, ensure_ascii=False)
+
     async def store_query_episode(
         self,
         natural_language: str,
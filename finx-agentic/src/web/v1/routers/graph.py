@@ -29,6 +29,7 @@ async def index_schemas(
         schema_path=body.schema_path,
         database=body.database,
         skip_existing=body.skip_existing,
+        force=body.force,
     )
     return IndexSchemaResponse(
         tables=stats.get("tables", 0),
@@ -37,6 +38,7 @@ async def index_schemas(
         edges=stats.get("edges", 0),
         domains=stats.get("domains", 0),
         skipped=stats.get("skipped", 0),
+        unchanged=stats.get("unchanged", 0),
     )
 
 
@@ -78,6 +78,7 @@ async def get_join_path(
         target=result.get("target", target),
         direct_joins=result.get("direct_joins", []),
         shared_intermediates=result.get("shared_intermediates", []),
+        join_path=result.get("join_path", []),
     )
 
 
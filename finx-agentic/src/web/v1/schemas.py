@@ -59,12 +59,14 @@ class JoinPathResponse(BaseModel):
     target: str
     direct_joins: List[Dict[str, Any]] = Field(default_factory=list)
     shared_intermediates: List[str] = Field(default_factory=list)
+    join_path: List[Dict[str, Any]] = Field(default_factory=list)
 
 
 class IndexSchemaRequest(BaseModel):
     schema_path: str
     database: Optional[str] = None
     skip_existing: bool = False
+    force: bool = False
 
 
 class IndexSchemaResponse(BaseModel):
@@ -74,6 +76,7 @@ class IndexSchemaResponse(BaseModel):
     edges: int = 0
     domains: int = 0
     skipped: int = 0
+    unchanged: int = 0
 
 
 class SyncRequest(BaseModel):
@@ -22,11 +22,13 @@ class IndexingService:
         schema_path: str,
         database: Optional[str] = None,
         skip_existing: bool = False,
+        force: bool = False,
     ) -> Dict[str, Any]:
         stats = await self._indexer.load_directory(
             schema_path=schema_path,
             database=database,
             skip_existing=skip_existing,
+            force=force,
         )
         return stats
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional
@@ -39,9 +40,11 @@ class SearchService:
         table_name: str,
         database: Optional[str] = None,
     ) -> Dict[str, Any]:
-        table_info = await self._entities.get_table(table_name, database)
-        columns = await self._entities.get_columns_for_table(table_name, database)
-        edges = await self._entities.search_entity_edges(table_name)
+        table_info, columns, edges = await asyncio.gather(
+            self._entities.get_table(table_name, database),
+            self._entities.get_columns_for_table(table_name, database),
+            self._entities.search_entity_edges(table_name),
+        )
         return {"table": table_info, "columns": columns, "edges": edges}
 
     async def find_related_tables(
@@ -58,8 +61,11 @@ class SearchService:
         target: str,
         database: Optional[str] = None,
     ) -> Dict[str, Any]:
-        source_rels = await self._entities.find_related_tables(source, database)
-        target_rels = await self._entities.find_related_tables(target, database)
+        source_rels, target_rels, join_path = await asyncio.gather(
+            self._entities.find_related_tables(source, database),
+            self._entities.find_related_tables(target, database),
+            self._entities.find_join_path(source, target, database),
+        )
         direct = [
             r for r in source_rels
             if target.lower() in r.get("table", "").lower()
@@ -72,6 +78,7 @@ class SearchService:
             "target": target,
             "direct_joins": direct,
             "shared_intermediates": list(shared),
+            "join_path": join_path,
         }
 
     async def resolve_term(self, term: str) -> Dict[str, Any]:
@@ -86,6 +93,8 @@ class SearchService:
         return await self._episodes.search_similar_queries(query, top_k=top_k)
 
     async def get_query_patterns(self, query: str) -> Dict[str, Any]:
-        patterns = await self._entities.search_patterns(query)
-        similar = await self._episodes.search_similar_queries(query, top_k=3)
+        patterns, similar = await asyncio.gather(
+            self._entities.search_patterns(query),
+            self._episodes.search_similar_queries(query, top_k=3),
+        )
         return {"patterns": patterns, "similar_queries": similar}